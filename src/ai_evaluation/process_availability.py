@@ -1,5 +1,7 @@
+import configparser
+import functools
 import os
-import google.generativeai as genai
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # --- Configuration ---
@@ -7,19 +9,30 @@ CONFIG_FILE = ".gemini"
 CONTEXT_FILE = "dancer-constraints-guide.md" # The markdown file you uploaded
 GRAMMAR_FILE = "grammar.py" # Useful to include strict rules if needed
 
-def load_config():
-    """Simple parser for .gemini config file (KEY=VALUE)."""
-    config = {}
+@functools.lru_cache(maxsize=1)
+def _read_config():
+    """Parse the .gemini file once; KEY=VALUE lines under an implied section."""
     if not os.path.exists(CONFIG_FILE):
         raise FileNotFoundError(f"Could not find {CONFIG_FILE}")
     
-    with open(CONFIG_FILE, 'r') as f:
-        for line in f:
-            if '=' in line:
-                key, value = line.strip().split('=', 1)
-                config[key.strip()] = value.strip()
-    return config
+    # Keep key case, split on '=' only, leave '%' in values alone, and let
+    # a repeated key override the earlier one
+    parser = configparser.ConfigParser(
+        delimiters=('=',), interpolation=None, allow_no_value=True, strict=False
+    )
+    parser.optionxform = str
+    parser.read_string('[default]\n' + Path(CONFIG_FILE).read_text())
+    
+    # Lines without '=' carry no value and are skipped, as before
+    return tuple(
+        (key, value) for key, value in parser['default'].items() if value is not None
+    )
 
+def load_config():
+    """Simple parser for .gemini config file (KEY=VALUE)."""
+    return dict(_read_config())
+
+@functools.lru_cache(maxsize=None)
 def load_file_content(filename):
     """Reads text content from a file."""
     try:
@@ -27,6 +40,7 @@ def load_file_content(filename):
     except FileNotFoundError:
         return f"Error: {filename} not found."
 
+@functools.lru_cache(maxsize=1)
 def get_system_instruction():
     """Combines the Markdown guide and Grammar file into a master instruction."""
     guide = load_file_content(CONTEXT_FILE)
@@ -49,52 +63,80 @@ def get_system_instruction():
     4. Do not explain your reasoning. Just the string.
     """
 
-def parse_dancer_availability(dancer_text):
-    config = load_config()
-    genai.configure(api_key=config.get("API_KEY"))
+@functools.lru_cache(maxsize=4)
+def get_model(model_name, system_instruction):
+    """Configured model, built once per (model, instruction) pair."""
+    import google.generativeai as genai
     
-    # Initialize the model
-    model = genai.GenerativeModel(
-        model_name=config.get("DEFAULT_MODEL", "gemini-1.5-pro"),
-        system_instruction=get_system_instruction()
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_instruction
     )
 
-    # Pre-load the few-shot examples we just created to enforce behavior
-    # This teaches the model the "User -> Correct Output" pattern
-    history = [
-        {
-            "role": "user",
-            "parts": ["April 18-30 out"]
-        },
-        {
-            "role": "model",
-            "parts": ["Apr 18 26 - Apr 30 26"]
-        },
-        {
-            "role": "user",
-            "parts": ["Away Feb.20 - March 14"]
-        },
-        {
-            "role": "model",
-            "parts": ["Feb 20 26 - Mar 14 26"]
-        },
-        {
-            "role": "user",
-            "parts": ["Camelot show March 22 24 25 26 Camelot rehearsal on Wednesdays until 1:00 pm on March 4 11 18"]
-        },
-        {
-            "role": "model",
-            "parts": ["Mar 22 26, Mar 24 26, Mar 25 26, Mar 26 26, Mar 4 26 until 1:00 PM, Mar 11 26 until 1:00 PM, Mar 18 26 until 1:00 PM"]
-        }
-    ]
+# Pre-load the few-shot examples we just created to enforce behavior
+# This teaches the model the "User -> Correct Output" pattern
+FEW_SHOT_HISTORY = (
+    {
+        "role": "user",
+        "parts": ["April 18-30 out"]
+    },
+    {
+        "role": "model",
+        "parts": ["Apr 18 26 - Apr 30 26"]
+    },
+    {
+        "role": "user",
+        "parts": ["Away Feb.20 - March 14"]
+    },
+    {
+        "role": "model",
+        "parts": ["Feb 20 26 - Mar 14 26"]
+    },
+    {
+        "role": "user",
+        "parts": ["Camelot show March 22 24 25 26 Camelot rehearsal on Wednesdays until 1:00 pm on March 4 11 18"]
+    },
+    {
+        "role": "model",
+        "parts": ["Mar 22 26, Mar 24 26, Mar 25 26, Mar 26 26, Mar 4 26 until 1:00 PM, Mar 11 26 until 1:00 PM, Mar 18 26 until 1:00 PM"]
+    }
+)
 
-    # Start chat with history
-    chat = model.start_chat(history=history)
+def parse_dancer_availability_batch(dancer_texts, max_workers=8):
+    """
+    Parse many dancer messages concurrently.
+    
+    Requests are network-bound, so they run on a thread pool; each message
+    is a single stateless generate_content call (no chat session).
+    
+    Returns:
+        List of constraint strings aligned with dancer_texts
+    """
+    # Imported here so importing this module stays cheap
+    import google.generativeai as genai
     
-    # Send the actual new request
-    response = chat.send_message(dancer_text)
+    config = load_config()
+    genai.configure(api_key=config.get("API_KEY"))
     
-    return response.text.strip()
+    # Initialize the model (reused across calls)
+    model = get_model(
+        config.get("DEFAULT_MODEL", "gemini-1.5-pro"),
+        get_system_instruction()
+    )
+    
+    def send(dancer_text):
+        # Few-shot turns followed by the actual new request
+        response = model.generate_content(
+            [*FEW_SHOT_HISTORY, {"role": "user", "parts": [dancer_text]}]
+        )
+        
+        return response.text.strip()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(send, dancer_texts))
+
+def parse_dancer_availability(dancer_text):
+    return parse_dancer_availability_batch([dancer_text], max_workers=1)[0]
 
 # --- Example Usage ---
 if __name__ == "__main__":
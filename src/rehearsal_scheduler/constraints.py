@@ -8,7 +8,7 @@ from typing import TypeAlias
 
 TimeInterval: TypeAlias = tuple[int, int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DayOfWeekConstraint:
     """Represents a constraint for an entire day of the week."""
     day_of_week: str
@@ -36,7 +36,7 @@ class DayOfWeekConstraint:
     #     return self.day_of_week == other.day_of_week
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeOnDayConstraint:
     """Represents a constraint for a specific time block on a given day."""
     day_of_week: str
@@ -61,7 +61,7 @@ class TimeOnDayConstraint:
     #     return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeOnDateConstraint:
     """Represents a time restriction on a specific date."""
     date: date           # Specific date, e.g., date(2025, 2, 2)
@@ -72,42 +72,34 @@ class TimeOnDateConstraint:
         return f"TimeOnDateConstraint(date={self.date}, start_time={self.start_time}, end_time={self.end_time})"
 
         
+@dataclass(frozen=True, slots=True)
 class DateConstraint:
     """Represents unavailability on a specific date."""
-    
-    def __init__(self, date: date):
-        self.date = date
-    
+    date: date
+
     def __repr__(self):
         return f"DateConstraint(date={self.date})"
-    
-    def __eq__(self, other):
-        return isinstance(other, DateConstraint) and self.date == other.date
 
 
+@dataclass(frozen=True, slots=True)
 class DateRangeConstraint:
     """Represents unavailability over a date range."""
-    
-    def __init__(self, start_date: date, end_date: date):
-        if end_date < start_date:
+    start_date: date
+    end_date: date
+
+    def __post_init__(self):
+        if self.end_date < self.start_date:
             raise ValueError("end_date must be >= start_date")
-        self.start_date = start_date
-        self.end_date = end_date
-    
+
     def __repr__(self):
         return f"DateRangeConstraint(start={self.start_date}, end={self.end_date})"
-    
-    def __eq__(self, other):
-        return (isinstance(other, DateRangeConstraint) and 
-                self.start_date == other.start_date and 
-                self.end_date == other.end_date)
 
         
 # You could also define a type alias for clarity
 Constraint = DayOfWeekConstraint | TimeOnDayConstraint | TimeOnDateConstraint | DateConstraint | DateRangeConstraint
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RehearsalSlot:
     """Represents a single, structured rehearsal event."""
     rehearsal_date: date
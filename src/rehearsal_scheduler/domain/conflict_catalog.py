@@ -197,8 +197,8 @@ def find_conflicts_by_dance(
     
     # For each dance
     for dance_id in dance_cast_df.columns:
-        # Get dancers in this dance (where value is '1')
-        dancers_in_dance = dance_cast_df[dance_cast_df[dance_id] == '1'].index.tolist()
+        # Get dancers in this dance (where value is 1)
+        dancers_in_dance = dance_cast_df[dance_cast_df[dance_id] == 1].index.tolist()
         
         conflicts = []
         
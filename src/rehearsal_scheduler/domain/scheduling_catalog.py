@@ -8,7 +8,7 @@ This is the scheduling-focused version that uses data from the Scheduling workbo
 """
 
 import pandas as pd
-from datetime import datetime, time
+from datetime import datetime
 from typing import Dict, List, Set
 from dataclasses import dataclass
 
@@ -188,16 +188,12 @@ def find_rd_availability(slot: RehearsalSlot, rd_constraints_df: pd.DataFrame) -
     """
     from rehearsal_scheduler.models.intervals import TimeInterval
     from rehearsal_scheduler.models.interval_operations import subtract_intervals
-    from datetime import time
     
     parser = constraint_parser()
     availability_list = []
     
     # Convert slot to TimeInterval
-    slot_interval = TimeInterval(
-        time(slot.start_time // 100, slot.start_time % 100),
-        time(slot.end_time // 100, slot.end_time % 100)
-    )
+    slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
     
     for _, row in rd_constraints_df.iterrows():
         rd_id = row['rd_id']
@@ -381,8 +377,8 @@ def find_conflicts_by_group(
         if dg_id in ineligible_group_ids:
             continue
         
-        # Get dancers in this group (where value is '1')
-        dancers_in_group = group_cast_df[group_cast_df[dg_id] == '1'].index.tolist()
+        # Get dancers in this group (where value is 1)
+        dancers_in_group = group_cast_df[group_cast_df[dg_id] == 1].index.tolist()
         
         conflicts = []
         
@@ -461,10 +457,7 @@ def find_availability_by_group(
     group_availability = {}
     
     # Convert slot to TimeInterval
-    slot_interval = TimeInterval(
-        time(slot.start_time // 100, slot.start_time % 100),
-        time(slot.end_time // 100, slot.end_time % 100)
-    )
+    slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
     
     # For each dance group
     for dg_id in group_cast_df.columns:
@@ -473,7 +466,7 @@ def find_availability_by_group(
             continue
         
         # Get dancers in this group
-        dancers_in_group = group_cast_df[group_cast_df[dg_id] == '1'].index.tolist()
+        dancers_in_group = group_cast_df[group_cast_df[dg_id] == 1].index.tolist()
         
         availability_info = []
         
@@ -585,10 +578,7 @@ def constraint_to_intervals(constraint, slot: RehearsalSlot) -> List:
     
     if isinstance(constraint, DayOfWeekConstraint):
         # Entire day unavailable = entire slot unavailable
-        return [TimeInterval(
-            time(slot.start_time // 100, slot.start_time % 100),
-            time(slot.end_time // 100, slot.end_time % 100)
-        )]
+        return [TimeInterval.from_military(slot.start_time, slot.end_time)]
     
     elif isinstance(constraint, TimeOnDayConstraint):
         # Time range on this day - intersect with slot
@@ -596,18 +586,12 @@ def constraint_to_intervals(constraint, slot: RehearsalSlot) -> List:
         constraint_end = min(constraint.end_time, slot.end_time)
         
         if constraint_start < constraint_end:
-            return [TimeInterval(
-                time(constraint_start // 100, constraint_start % 100),
-                time(constraint_end // 100, constraint_end % 100)
-            )]
+            return [TimeInterval.from_military(constraint_start, constraint_end)]
         return []
     
     elif isinstance(constraint, (DateConstraint, DateRangeConstraint)):
         # Entire date unavailable = entire slot unavailable
-        return [TimeInterval(
-            time(slot.start_time // 100, slot.start_time % 100),
-            time(slot.end_time // 100, slot.end_time % 100)
-        )]
+        return [TimeInterval.from_military(slot.start_time, slot.end_time)]
     
     elif isinstance(constraint, TimeOnDateConstraint):
         # Time range on this date - intersect with slot
@@ -615,10 +599,7 @@ def constraint_to_intervals(constraint, slot: RehearsalSlot) -> List:
         constraint_end = min(constraint.end_time, slot.end_time)
         
         if constraint_start < constraint_end:
-            return [TimeInterval(
-                time(constraint_start // 100, constraint_start % 100),
-                time(constraint_end // 100, constraint_end % 100)
-            )]
+            return [TimeInterval.from_military(constraint_start, constraint_end)]
         return []
     
     return []
@@ -669,7 +650,7 @@ def calculate_full_availability_for_group(
     parser = constraint_parser()
     
     # Get dancers in this group
-    dancers_in_group = group_cast_df[group_cast_df[dg_id] == '1'].index.tolist()
+    dancers_in_group = group_cast_df[group_cast_df[dg_id] == 1].index.tolist()
     
     if not dancers_in_group:
         return ("No dancers", "No dancers", "No dancers")
@@ -832,10 +813,7 @@ def generate_scheduling_catalog(
         
         # Create slot interval for availability calculations
         from rehearsal_scheduler.models.intervals import TimeInterval
-        slot_interval = TimeInterval(
-            time(slot.start_time // 100, slot.start_time % 100),
-            time(slot.end_time // 100, slot.end_time % 100)
-        )
+        slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
         
         # Find RD conflicts or availability
         if show_availability:
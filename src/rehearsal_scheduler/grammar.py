@@ -1,7 +1,10 @@
 # rehearsal-scheduler/src/rehearsal_scheduler/grammar.py
 
-import inspect
-from datetime import time, date
+import functools
+import itertools
+import sys
+from types import MappingProxyType
+from datetime import date
 from lark import Lark, Transformer, v_args
 from lark.exceptions import UnexpectedInput, UnexpectedCharacters, UnexpectedToken
 
@@ -14,23 +17,73 @@ from rehearsal_scheduler.constraints import (
     DateRangeConstraint
 )
 
-DEBUG = False
-
 def type_and_value(obj):  # pragma: no cover
     """Helper for debugging: returns the type and value of an object."""
-    if DEBUG:
-        return f"{type(obj)}: {repr(obj)}"
-    return ""
+    return f"{type(obj)}: {repr(obj)}"
 
 class SemanticValidationError(ValueError):
     """Custom exception for semantic errors during parsing."""
     pass
 
+
+# 12-hour clock to 24-hour clock, indexed by the HOUR terminal (1-12).
+# Without AM/PM, 1-7 and 12 are taken as afternoon/evening; a bare 12 maps
+# to 24 and is rejected by _military().
+_IMPLIED_PM = frozenset({1, 2, 3, 4, 5, 6, 7, 12})
+_NO_SUFFIX_HOURS = tuple(h + 12 if h in _IMPLIED_PM else h for h in range(13))
+_AM_HOURS = tuple(h % 12 for h in range(13))
+_PM_HOURS = tuple(h % 12 + 12 for h in range(13))
+
+# AM_PM terminal text (any casing) -> hour table, so no str.lower() is needed.
+_AM_PM_HOURS = {
+    **dict.fromkeys(("am", "AM", "Am", "aM"), _AM_HOURS),
+    **dict.fromkeys(("pm", "PM", "Pm", "pM"), _PM_HOURS),
+}
+
+
+def _military(hour, minute):
+    """Pack an hour and minute into military time, e.g. (13, 15) -> 1315."""
+    if hour > 23:
+        raise SemanticValidationError("hour must be in 0..23")
+    return hour * 100 + minute
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_date(month, day, year):
+    """Create date object and validate it; a season reuses few dates."""
+    try:
+        return date(year, month, day)
+    except ValueError as e:
+        raise SemanticValidationError(f"Invalid date: {e}")
+
+
+def _format_military(value):
+    """Render military time like datetime.time does, e.g. 1315 -> '13:15:00'."""
+    return f"{value // 100:02d}:{value % 100:02d}:00"
+
 # Month name to number mapping
-MONTH_MAP = {
+MONTH_MAP = MappingProxyType({
     "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4,
     "MAY": 5, "JUN": 6, "JUL": 7, "AUG": 8,
     "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12,
+})
+
+# Day-of-week terminal names, handled by ConstraintTransformer.__default_token__.
+# These private tables stay plain dicts, which look up faster than a
+# MappingProxyType. Day names are interned so every constraint shares one
+# string object per day and equality checks hit the identity fast path.
+_DAY_MAP = {
+    name: sys.intern(name.lower())
+    for name in ("MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY",
+                 "FRIDAY", "SATURDAY", "SUNDAY")
+}
+
+# Month abbreviation in every casing ("jan", "Jan", "jAN", ...) -> number,
+# so MONTH_TEXT is a single dict lookup with no str.upper() allocation.
+_MONTH_MAP_CI = {
+    "".join(chars): v
+    for k, v in MONTH_MAP.items()
+    for chars in itertools.product(*((c.lower(), c) for c in k))
 }
 
 # ===================================================================
@@ -40,29 +93,30 @@ GRAMMAR = r"""
     start: constraint ("," constraint)*
 
     // A constraint can be either temporal (day/time) or date-based
-    constraint: temporal_constraint | date_constraint
+    ?constraint: temporal_constraint | date_constraint
 
     // === TEMPORAL CONSTRAINTS (existing) ===
     temporal_constraint: day_spec (time_spec)?
 
-    day_spec: MONDAY | TUESDAY | WEDNESDAY | THURSDAY | FRIDAY | SATURDAY | SUNDAY
+    ?day_spec: MONDAY | TUESDAY | WEDNESDAY | THURSDAY | FRIDAY | SATURDAY | SUNDAY
 
-    time_spec: after_spec | before_spec | time_range
+    ?time_spec: after_spec | before_spec | time_range
 
     after_spec: "after"i tod
     before_spec: ("before"i | "until"i) tod
     time_range: tod "-" tod
 
-    tod: std_time | military_time
+    ?tod: std_time | military_time
       
     std_time: HOUR (":" MINUTE)? AM_PM?
     military_time: MILITARY_TIME
 
     // === DATE CONSTRAINTS (new) ===
-    date_constraint: date_value (time_spec)? 
-                   | date_value ("-" date_value)?
+    date_constraint: date_value                  -> single_date
+                   | date_value "-" date_value   -> date_range
+                   | date_value time_spec        -> time_on_date
 
-    date_value: mdy_slash | mdy_text
+    ?date_value: mdy_slash | mdy_text
 
     // Format 1: MM/DD/YYYY (year required)
     mdy_slash: MONTH_NUM "/" DAY_NUM "/" YEAR
@@ -73,30 +127,29 @@ GRAMMAR = r"""
     // === TERMINALS ===
     
     // Time terminals
-    MILITARY_TIME.2: /([01][0-9]|2[0-3])[0-5][0-9]/    
-    HOUR.1: "1" | "2" | "3" | "4" | "5" | "6" | "7" | "8" | "9" | "10" | "11" | "12"
-    MINUTE: "00" | "01" | "02" | "03" | "04" | "05" | "06" | "07" | "08" | "09" 
-          | "10" | "11" | "12" | "13" | "14" | "15" | "16" | "17" | "18" | "19" 
-          | "20" | "21" | "22" | "23" | "24" | "25" | "26" | "27" | "28" | "29" 
-          | "30" | "31" | "32" | "33" | "34" | "35" | "36" | "37" | "38" | "39" 
-          | "40" | "41" | "42" | "43" | "44" | "45" | "46" | "47" | "48" | "49" 
-          | "50" | "51" | "52" | "53" | "54" | "55" | "56" | "57" | "58" | "59"
+    MILITARY_TIME.2: /[0-2][0-9][0-5][0-9]/    
+    HOUR.1: /1[0-2]|[1-9]/
+    MINUTE: /[0-5][0-9]/
     AM_PM: "am"i | "pm"i
 
-    // Day of week terminals
-    MONDAY:    "monday"i    | "mon"i   | "mo"i | "m"i
-    TUESDAY:   "tuesday"i   | "tues"i  | "tu"i
-    WEDNESDAY: "wednesday"i | "wed"i   | "we"i | "w"i
-    THURSDAY:  "thursday"i  | "thurs"i | "th"i
-    FRIDAY:    "friday"i    | "fri"i   | "fr"i | "f"i
-    SATURDAY:  "saturday"i  | "sat"i   | "sa"i
-    SUNDAY:    "sunday"i    | "sun"i   | "su"i
+    // Day of week terminals: each abbreviation is a prefix of the full
+    // name, so nested optionals replace the alternations.
+    //   monday|mon|mo|m, tuesday|tues|tu, wednesday|wed|we|w,
+    //   thursday|thurs|th, friday|fri|fr|f, saturday|sat|sa, sunday|sun|su
+    MONDAY:    /m(o(n(day)?)?)?/i
+    TUESDAY:   /tu(es(day)?)?/i
+    WEDNESDAY: /w(e(d(nesday)?)?)?/i
+    THURSDAY:  /th(urs(day)?)?/i
+    FRIDAY:    /f(r(i(day)?)?)?/i
+    SATURDAY:  /sa(t(urday)?)?/i
+    SUNDAY:    /su(n(day)?)?/i
 
     // Date terminals
     MONTH_TEXT.2: /(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)/i
     YEAR.1: /\d{4}|\d{2}/
-    MONTH_NUM.1: /1[0-2]|0?[1-9]/
-    DAY_NUM.1: /[12][0-9]|3[01]|0?[1-9]/
+    // Month/day ranges are checked by _resolve_date, not the lexer.
+    MONTH_NUM.1: /\d{1,2}/
+    DAY_NUM.1: /\d{1,2}/
 
     %import common.WS
     %ignore WS
@@ -104,57 +157,54 @@ GRAMMAR = r"""
 
 @v_args(inline=True)
 class ConstraintTransformer(Transformer):
-    """Transforms the parsed Lark tree into constraint objects."""
+    """
+    Transforms the parsed Lark tree into constraint objects.
+
+    Passed to Lark(transformer=...), so callbacks run during the LALR parse
+    and no Tree is ever built. Keep this a plain Transformer: Lark wraps
+    Transformer_InPlace callbacks to allocate a Tree per rule instead.
+
+    Debug output belongs to the instance, set by constraint_parser(debug=...),
+    so a debug parser never turns it on for the shared default parser.
+    Guards are written as "if __debug__ and self.debug:" so that python -O
+    compiles them away.
+    """
+    def __init__(self, debug=False):
+        super().__init__()
+        self.debug = debug
+
     def __default__(self, data, children, meta):
         # print(f"Transforming rule: {data}, children: {children}")
         return super().__default__(data, children, meta)
 
-    def HOUR(self, h):
-        return int(h)
-
-    def MINUTE(self, m):
-        return int(m)
-        
-    def AM_PM(self, am_pm):
-        if DEBUG:                         # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(am_pm)}")
-        return am_pm.lower()
-        
-    # --- Day of Week Terminals ---
-    def MONDAY(self, _): return "monday"
-    def TUESDAY(self, _): return "tuesday"
-    def WEDNESDAY(self, _): return "wednesday"
-    def THURSDAY(self, _): return "thursday"
-    def FRIDAY(self, _): return "friday"
-    def SATURDAY(self, _): return "saturday"
-    def SUNDAY(self, _): return "sunday"
-
-    # --- Date Terminals ---
-    def YEAR(self, token):
-        """Convert year token to int, handling 2-digit years."""
-        year_val = int(token)
-        if year_val < 100:
-            return 2000 + year_val
-        return year_val
-    
-    def MONTH_NUM(self, token):
-        return int(token)
-    
-    def DAY_NUM(self, token):
-        return int(token)
-    
-    def MONTH_TEXT(self, token):
-        return MONTH_MAP[token.upper()]
+    def __default_token__(self, token):
+        """Convert YEAR and day-of-week terminals."""
+        t = token.type
+        if t == "YEAR":
+            year_val = int(token)
+            # Two-digit years are taken to be 20xx.
+            return 2000 + year_val if year_val < 100 else year_val
+        return _DAY_MAP.get(t, token)
+
+    # When the transformer runs inside Lark.parse, terminal callbacks are
+    # looked up by name. Where a C-level callable does the whole
+    # conversion it is bound directly, skipping a Python-level call.
+    HOUR = MINUTE = MONTH_NUM = DAY_NUM = staticmethod(int)
+    AM_PM = staticmethod(_AM_PM_HOURS.__getitem__)   # -> hour table for std_time
+    MONTH_TEXT = staticmethod(_MONTH_MAP_CI.__getitem__)
+    YEAR = __default_token__
+    MONDAY = TUESDAY = WEDNESDAY = THURSDAY = FRIDAY = __default_token__
+    SATURDAY = SUNDAY = __default_token__
 
     def start(self, *items):
         """Return list of constraints."""
-        if DEBUG:
+        if __debug__ and self.debug:            # pragma: no cover
             print(f"start() received {len(items)} items: {items}")
         
         # Convert tuple to list
         result = list(items)
         
-        if DEBUG:
+        if __debug__ and self.debug:            # pragma: no cover
             print(f"start() returning: {result}")
         
         return result
@@ -162,155 +212,74 @@ class ConstraintTransformer(Transformer):
     # --- Time Parsing (existing logic) ---
     @v_args(inline=False)
     def military_time(self, children):
-        if DEBUG:                         # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(children)}")
-        token = children[0]
-        hour = int(token[0:2])
-        minute = int(token[2:4])
-        return (hour, minute)
-
-    @v_args(inline=False)
-    def tod(self, children):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(children)}")
-        if not children:  
-            # I think this is not possible
-            return None           # pragma: no cover
-        h, m = children[0]
-        return time(h, m)
+        if __debug__ and self.debug:           # pragma: no cover
+            print(f"military_time {type_and_value(children)}")
+        # The terminal admits hours up to 29; the range is checked here.
+        value = int(children[0])
+        return _military(value // 100, value % 100)
 
     @v_args(inline=False)
     def std_time(self, children):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(children)}")
-        if len(children) == 3:
-            h, m, fmt = children
-            if fmt == 'pm' and h != 12:
-                h += 12
-            elif fmt == 'am' and h == 12:
-                h = 0
-            return (h, m)
-        if len(children) == 2:
-            h, opt = children
-            if isinstance(opt, str):
-                if opt == 'pm' and h != 12:
-                    h += 12
-                elif opt == 'am' and h == 12:
-                    h = 0
-                return (h, 0)
+        if __debug__ and self.debug:            # pragma: no cover
+            print(f"std_time {type_and_value(children)}")
+        # children: HOUR, then optional MINUTE (int) and/or AM_PM (hour table)
+        h, m, hours = children[0], 0, _NO_SUFFIX_HOURS
+        for child in children[1:]:
+            if isinstance(child, int):
+                m = child
             else:
-                if h in [1, 2, 3, 4, 5, 6, 7, 12]:
-                    h += 12
-                # if h == 24:    Not allowed
-                #     h = 12
-                return (h, opt)
-        
-        h = children[0]
-        if h in [1, 2, 3, 4, 5, 6, 7, 12]:
-            h += 12
-        # if h == 24:  Not allowed
-        #     h = 12
-        return (h, 0)
+                hours = child
+        return _military(hours[h], m)
 
     def time_range(self, start_time, end_time):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(start_time)} {type_and_value(end_time)}")
+        if __debug__ and self.debug:            # pragma: no cover
+            print(f"time_range {type_and_value(start_time)} {type_and_value(end_time)}")
         if start_time >= end_time:
-            raise SemanticValidationError(f"Start time {start_time} must be before end time {end_time}.")
+            raise SemanticValidationError(
+                f"Start time {_format_military(start_time)} must be before "
+                f"end time {_format_military(end_time)}."
+            )
         return (start_time, end_time)
 
     def after_spec(self, start_time):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(start_time)}")
-        return (start_time, time(23, 59))
+        if __debug__ and self.debug:            # pragma: no cover
+            print(f"after_spec {type_and_value(start_time)}")
+        return (start_time, 2359)
 
     def before_spec(self, end_time):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(end_time)}")
-        return (time(0, 0), end_time)
-
-    def time_spec(self, time_tuple):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(time_tuple)}")
-        return time_tuple
-
-    def day_spec(self, day_of_week_str):
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]} {type_and_value(day_of_week_str)}")
-        return day_of_week_str
+        if __debug__ and self.debug:            # pragma: no cover
+            print(f"before_spec {type_and_value(end_time)}")
+        return (0, end_time)
 
     # --- Date Parsing (new) ---
-    def _resolve_date(self, month, day, year):
-        """Create date object and validate it."""
-        try:
-            return date(year, month, day)
-        except ValueError as e:
-            raise ValueError(f"Invalid date: {e}")
-
     def mdy_slash(self, month, day, year):
         """Process MM/DD/YYYY format."""
-        return self._resolve_date(month, day, year)
+        return _resolve_date(month, day, year)
     
     def mdy_text(self, month, day, year):
         """Process 'Jan 15 2026' format."""
-        return self._resolve_date(month, day, year)
-    
-    def date_value(self, date_obj):
-        return date_obj
+        return _resolve_date(month, day, year)
 
-    def date_constraint(self, *items):
-        """Process single date, date range, or date with time spec."""
-        if DEBUG:                          # pragma: no cover
-            print(f"date_constraint got {len(items)} items: {items}")
-        
-        if len(items) == 1:
-            # Single date (no time)
-            result = DateConstraint(date=items[0])
-            if DEBUG:                          # pragma: no cover
-                print(f"date_constraint got {len(items)} items: {items}")
-                print(f"Returning: {result}")
-            return result
-        elif len(items) == 2:
-            first, second = items
-            if DEBUG:                          # pragma: no cover
-                print(f"first: {type(first)} = {first}")
-                print(f"second: {type(second)} = {second}")
-            
-            # Check if second item is a date (date range) or tuple (time spec)
-            if isinstance(second, date):
-                # Date range: date_value "-" date_value
-                if second < first:
-                    raise SemanticValidationError(
-                        f"Invalid range: end date {second} is before start date {first}"
-                    )
-                result = DateRangeConstraint(start_date=first, end_date=second)
-                if DEBUG:                          # pragma: no cover
-                    print(f"Returning: {result}")
-                return result
-            else:
-                # Date with time spec: date_value (time_spec)
-                date_obj = first
-                time_spec_tuple = second
-                start_time, end_time = time_spec_tuple
-                start_time_int = start_time.hour * 100 + start_time.minute
-                end_time_int = end_time.hour * 100 + end_time.minute
-                result = TimeOnDateConstraint(
-                    date=date_obj,
-                    start_time=start_time_int,
-                    end_time=end_time_int
-                )
-                if DEBUG:                          # pragma: no cover
-                    print(f"Returning: {result}")
-                return result
-
-    def constraint(self, items):
-        """Pass through the constraint."""
-        if DEBUG:                          # pragma: no cover
-            if isinstance(items, list):
-                print(f"{inspect.stack()[0][3]} {type_and_value(items[0])}")
-            else:
-                print(f"{inspect.stack()[0][3]} {type_and_value(items)}")
-        return items[0] if isinstance(items, list) else items
+    def single_date(self, date_obj):
+        """Process a single date (no time)."""
+        return DateConstraint(date=date_obj)
+
+    def date_range(self, start_date, end_date):
+        """Process date_value "-" date_value."""
+        if end_date < start_date:
+            raise SemanticValidationError(
+                f"Invalid range: end date {end_date} is before start date {start_date}"
+            )
+        return DateRangeConstraint(start_date=start_date, end_date=end_date)
+
+    def time_on_date(self, date_obj, time_spec_tuple):
+        """Process a date with a time spec."""
+        start_time, end_time = time_spec_tuple
+        return TimeOnDateConstraint(
+            date=date_obj,
+            start_time=start_time,
+            end_time=end_time
+        )
 
     # --- Temporal Constraint Assembly (existing) ---
     def temporal_constraint(self, day_of_week_str, time_spec_tuple=None):
@@ -318,62 +287,79 @@ class ConstraintTransformer(Transformer):
         Processes a temporal constraint: day and optional time spec.
         Returns either a DayOfWeekConstraint or a TimeOnDayConstraint.
         """
-        if DEBUG:                          # pragma: no cover
-            print(f"{inspect.stack()[0][3]}  {type_and_value(day_of_week_str)} {type_and_value(time_spec_tuple)}")
+        if __debug__ and self.debug:            # pragma: no cover
+            print(f"temporal_constraint  {type_and_value(day_of_week_str)} {type_and_value(time_spec_tuple)}")
         if time_spec_tuple:
             start_time, end_time = time_spec_tuple
-            start_time_int = start_time.hour * 100 + start_time.minute
-            end_time_int = end_time.hour * 100 + end_time.minute
             return TimeOnDayConstraint(
                 day_of_week=day_of_week_str,
-                start_time=start_time_int,
-                end_time=end_time_int
+                start_time=start_time,
+                end_time=end_time
             )
         else:
             return DayOfWeekConstraint(day_of_week=day_of_week_str)
 
 
-def constraint_parser(grammar=GRAMMAR, start='start', debug=False):
-    constraint_transformer = ConstraintTransformer()
-    global DEBUG 
-    DEBUG = debug
+def _build_parser(grammar, debug):
+    # Positions and [] placeholders are never used by the transformer.
+    # The contextual lexer is required: HOUR, MONTH_NUM, DAY_NUM and YEAR
+    # overlap and the basic lexer cannot tell them apart.
+    # cache=True stores the analysed LALR tables in the temp directory under
+    # a name hashed from the grammar, options and Lark version, so editing
+    # GRAMMAR invalidates it automatically.
+    constraint_transformer = ConstraintTransformer(debug=debug)
     return Lark(
         grammar, 
         parser='lalr', 
+        lexer='contextual',
+        cache=True,
         transformer=constraint_transformer,
+        propagate_positions=False,
+        maybe_placeholders=False,
         debug=debug
     )
 
 
+@functools.cache
+def _default_parser():
+    """Build the standard parser on first use and share it afterwards."""
+    return _build_parser(GRAMMAR, debug=False)
+
+
+def constraint_parser(grammar=GRAMMAR, start='start', debug=False):
+    """
+    Return a Lark parser that yields constraint objects.
+
+    The default configuration is built once per process and shared; the
+    transformer keeps no state, so the instance is safe to reuse.
+    """
+    if grammar is GRAMMAR and not debug:
+        return _default_parser()
+    return _build_parser(grammar, debug)
+
+
 def unexpected_input_message(token, exc):    # pragma: no cover
     # I have not found a case to trigger this...
-    pointer = exc.column * " " + "^"
-    emsg = f"{token}\n{pointer}\nExpected: {exc.expected}"
-    return emsg
+    return f"{token}\n{'':{exc.column}}^\nExpected: {exc.expected}"
 
 
 def value_error_message(token, exc):
-    emsg = f"{token}: {exc}"
-    return emsg
+    return f"{token}: {exc}"
 
 
 def unexpected_characters_message(token, exc):
-    pointer = exc.column * " " + "^"
-    emsg = f"{token}\n{pointer}\nExpected one of {exc.allowed}"
-    return emsg
+    return f"{token}\n{'':{exc.column}}^\nExpected one of {exc.allowed}"
 
 
 def unexpected_token_message(token, exc):
-    pointer = (exc.column-1) * " " + "^"
-    emsg = f"{token}\n{pointer}\nExpected: {exc.expected}"
-    return emsg
+    return f"{token}\n{'':{max(exc.column - 1, 0)}}^\nExpected: {exc.expected}"
 
 
-def validate_token(token: str):
-    parser = constraint_parser()
+def _parse_token(parser, token: str):
+    """Parse a token with the given parser, returning (tuple, None) or (None, msg)."""
     try:
         result = parser.parse(token)
-        return result, None
+        return tuple(result), None
     except ValueError as e:
         return None, value_error_message(token, e)
     except UnexpectedToken as e:
@@ -383,3 +369,52 @@ def validate_token(token: str):
     except UnexpectedInput as e:                 # pragma: no cover
         # I have not found a case to trigger this...
         return None, unexpected_input_message(token, e)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_token_cached(token: str):
+    """
+    Parse a token once and remember the outcome.
+
+    Results are stored as tuples so the cached value cannot be mutated by
+    callers; error messages are cached alongside successful parses.
+    """
+    return _parse_token(_default_parser(), token)
+
+
+def _as_result(outcome):
+    result, error = outcome
+    if result is None:
+        return None, error
+    return list(result), None
+
+
+def validate_token(token: str):
+    """
+    Validate a constraint token, returning (constraints, error_message).
+
+    Schedulers re-check the same availability strings many times, so the
+    parse outcome is memoized per distinct token string.
+    """
+    return _as_result(_validate_token_cached(token))
+
+
+def validate_tokens(tokens):
+    """
+    Validate many constraint tokens in one call.
+
+    Shares the process-wide parser and the validate_token cache, so each
+    distinct token is parsed at most once.
+
+    Args:
+        tokens: Iterable of constraint strings
+
+    Returns:
+        List of (constraints, error_message) pairs, in input order, each
+        shaped like the return value of validate_token().
+
+    Example:
+        >>> for result, error in validate_tokens(["mon", "tues 2-4"]):
+        ...     assert error is None
+    """
+    return [_as_result(_validate_token_cached(token)) for token in tokens]
@@ -7,12 +7,76 @@ Uses TimeInterval dataclass for type safety.
 All operations treat adjacent intervals as mergeable and filter out zero-duration intervals.
 """
 
-from typing import List
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence, Tuple
 from datetime import time
 
 from rehearsal_scheduler.models.intervals import TimeInterval
 
 
+# Internally intervals are handled as parallel arrays of start/end minutes
+# since midnight; TimeInterval objects are only built at the API boundary.
+
+def _to_minute_pairs(intervals: List[TimeInterval]) -> Tuple[array, array]:
+    """Split intervals into parallel uint16 arrays of start and end minutes."""
+    starts = array('H', [iv.start_min for iv in intervals])
+    ends = array('H', [iv.end_min for iv in intervals])
+    return starts, ends
+
+
+# Shared time object for every minute of the day; time is immutable
+_MIN_TO_TIME = tuple(time(m // 60, m % 60) for m in range(24 * 60))
+
+
+def _from_minutes(start: int, end: int) -> TimeInterval:
+    """Build a TimeInterval from minutes since midnight."""
+    return TimeInterval(_MIN_TO_TIME[start], _MIN_TO_TIME[end])
+
+
+def _merge_minutes(starts: Sequence[int], ends: Sequence[int]) -> Tuple[array, array]:
+    """
+    Merge overlapping or adjacent runs in start-sorted minute sequences.
+    
+    Returns new parallel arrays, one entry per merged run.
+    """
+    out_starts = array('H')
+    out_ends = array('H')
+    add_start = out_starts.append
+    add_end = out_ends.append
+    s, e = starts[0], ends[0]
+    
+    for cs, ce in zip(starts[1:], ends[1:]):
+        # Same test as intervals_overlap(): max(starts) <= min(ends)
+        if cs <= e and s <= ce:
+            if ce > e:
+                e = ce
+        else:
+            add_start(s)
+            add_end(e)
+            s, e = cs, ce
+    
+    add_start(s)
+    add_end(e)
+    return out_starts, out_ends
+
+
+def _union_minutes(intervals: List[TimeInterval]) -> Tuple[array, array]:
+    """Minute-array core of union_intervals(): filter, sort by start, merge."""
+    # One pass reads the cached minutes and drops zero-duration intervals;
+    # tuples sort in C with no key callback. Ties on start may reorder by
+    # end, which cannot change the merged result.
+    pairs = sorted(
+        (iv.start_min, iv.end_min) for iv in intervals
+        if iv.end_min > iv.start_min
+    )
+    if not pairs:
+        return array('H'), array('H')
+    
+    starts, ends = zip(*pairs)
+    return _merge_minutes(starts, ends)
+
+
 def interval_duration(interval: TimeInterval) -> int:
     """
     Calculate interval duration in minutes.
@@ -51,11 +115,8 @@ def intervals_overlap(a: TimeInterval, b: TimeInterval) -> bool:
         ... )
         True
     """
-    # Convert to minutes for easier comparison
-    a_start = a.start.hour * 60 + a.start.minute
-    a_end = a.end.hour * 60 + a.end.minute
-    b_start = b.start.hour * 60 + b.start.minute
-    b_end = b.end.hour * 60 + b.end.minute
+    a_start, a_end = a.start_min, a.end_min
+    b_start, b_end = b.start_min, b.end_min
     
     # Overlap if: max(starts) <= min(ends)
     # Using <= (not <) to treat adjacent as overlapping
@@ -80,11 +141,8 @@ def intersect_intervals(a: TimeInterval, b: TimeInterval) -> List[TimeInterval]:
         ... )
         [TimeInterval(start=time(11, 0), end=time(14, 0))]
     """
-    # Convert to minutes
-    a_start = a.start.hour * 60 + a.start.minute
-    a_end = a.end.hour * 60 + a.end.minute
-    b_start = b.start.hour * 60 + b.start.minute
-    b_end = b.end.hour * 60 + b.end.minute
+    a_start, a_end = a.start_min, a.end_min
+    b_start, b_end = b.start_min, b.end_min
     
     # Calculate overlap
     overlap_start = max(a_start, b_start)
@@ -94,11 +152,7 @@ def intersect_intervals(a: TimeInterval, b: TimeInterval) -> List[TimeInterval]:
     if overlap_start >= overlap_end:
         return []
     
-    # Convert back to time
-    start_time = time(overlap_start // 60, overlap_start % 60)
-    end_time = time(overlap_end // 60, overlap_end % 60)
-    
-    return [TimeInterval(start_time, end_time)]
+    return [_from_minutes(overlap_start, overlap_end)]
 
 
 def merge_adjacent_intervals(intervals: List[TimeInterval]) -> List[TimeInterval]:
@@ -116,27 +170,8 @@ def merge_adjacent_intervals(intervals: List[TimeInterval]) -> List[TimeInterval
     if not intervals:
         return []
     
-    merged = [intervals[0]]
-    
-    for current in intervals[1:]:
-        last = merged[-1]
-        
-        # Check if current overlaps or is adjacent to last
-        if intervals_overlap(last, current):
-            # Merge by extending the end time
-            last_end_mins = last.end.hour * 60 + last.end.minute
-            curr_end_mins = current.end.hour * 60 + current.end.minute
-            new_end_mins = max(last_end_mins, curr_end_mins)
-            
-            merged[-1] = TimeInterval(
-                last.start,
-                time(new_end_mins // 60, new_end_mins % 60)
-            )
-        else:
-            # No overlap - add as separate interval
-            merged.append(current)
-    
-    return merged
+    starts, ends = _merge_minutes(*_to_minute_pairs(intervals))
+    return [_from_minutes(s, e) for s, e in zip(starts, ends)]
 
 
 def union_intervals(intervals: List[TimeInterval]) -> List[TimeInterval]:
@@ -162,20 +197,8 @@ def union_intervals(intervals: List[TimeInterval]) -> List[TimeInterval]:
     if not intervals:
         return []
     
-    # Filter out zero-duration intervals
-    non_zero = [iv for iv in intervals if interval_duration(iv) > 0]
-
-    if not non_zero:       # pragman: no cover
-        return []
-    
-    # Sort by start time
-    sorted_intervals = sorted(
-        non_zero,
-        key=lambda iv: (iv.start.hour * 60 + iv.start.minute)
-    )
-    
-    # Merge adjacent/overlapping intervals
-    return merge_adjacent_intervals(sorted_intervals)
+    starts, ends = _union_minutes(intervals)
+    return [_from_minutes(s, e) for s, e in zip(starts, ends)]
 
 
 def subtract_intervals(base: TimeInterval, subtracts: List[TimeInterval]) -> List[TimeInterval]:
@@ -213,52 +236,28 @@ def subtract_intervals(base: TimeInterval, subtracts: List[TimeInterval]) -> Lis
         return [base]
     
     # Merge overlapping subtract intervals first
-    merged_subtracts = union_intervals(subtracts)
+    sub_starts, sub_ends = _union_minutes(subtracts)
     
-    # Start with base interval
-    remaining = [base]
+    base_start = base.start_min
+    base_end = base.end_min
     
-    # Subtract each interval
-    for sub in merged_subtracts:
-        new_remaining = []
-        for piece in remaining:
-            # Inline the subtract logic (previously in subtract_interval)
-            # Convert to minutes
-            base_start = piece.start.hour * 60 + piece.start.minute
-            base_end = piece.end.hour * 60 + piece.end.minute
-            sub_start = sub.start.hour * 60 + sub.start.minute
-            sub_end = sub.end.hour * 60 + sub.end.minute
-            
-            # No overlap - keep original piece
-            if sub_end <= base_start or sub_start >= base_end:
-                new_remaining.append(piece)
-                continue
-            
-            # Complete overlap - skip piece (nothing left)
-            if sub_start <= base_start and sub_end >= base_end:
-                continue
-            
-            # Partial overlap - create remaining pieces
-            # Left piece exists
-            if base_start < sub_start:
-                left_end = min(sub_start, base_end)
-                new_remaining.append(TimeInterval(
-                    time(base_start // 60, base_start % 60),
-                    time(left_end // 60, left_end % 60)
-                ))
-            
-            # Right piece exists
-            if base_end > sub_end:
-                right_start = max(sub_end, base_start)
-                new_remaining.append(TimeInterval(
-                    time(right_start // 60, right_start % 60),
-                    time(base_end // 60, base_end % 60)
-                ))
-        
-        remaining = new_remaining
-        
-        # Early exit if nothing left
-        if not remaining:
-            break
+    # Merged subtracts are sorted and disjoint, so both arrays are ascending:
+    # binary-search the slice that can touch the base instead of scanning all.
+    lo = bisect_right(sub_ends, base_start)
+    hi = bisect_left(sub_starts, base_end)
+    
+    # Sweep left to right: everything before the cursor is final, so each
+    # subtract only ever splits the single piece starting at the cursor.
+    remaining = []
+    cursor = base_start
+    for sub_start, sub_end in zip(sub_starts[lo:hi], sub_ends[lo:hi]):
+        # Gap before this subtract survives
+        if sub_start > cursor:
+            remaining.append(_from_minutes(cursor, sub_start))
+        cursor = sub_end
+    
+    # Tail after the last subtract
+    if cursor < base_end:
+        remaining.append(_from_minutes(cursor, base_end))
     
-    return remaining
\ No newline at end of file
+    return remaining
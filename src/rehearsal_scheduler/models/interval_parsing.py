@@ -5,13 +5,32 @@ Utilities for parsing formatted time interval strings back into TimeInterval obj
 Used by the scheduler to work with availability windows.
 """
 
+from bisect import bisect_left
 from datetime import time
-from typing import List
-import re
+from typing import List, Tuple
+import functools
 
 from rehearsal_scheduler.models.intervals import TimeInterval
 
 
+# Hour offset to 24-hour clock, keyed by (meridiem, hour == 12):
+# 12:xx am is midnight, 12:xx pm is noon
+_HOUR_OFFSETS = {
+    ('am', False): 0,
+    ('am', True): -12,
+    ('pm', False): 12,
+    ('pm', True): 0,
+}
+
+# One "7:00 pm - 8:30 pm" interval, for whole-column extraction. Only
+# accepts strings parse_interval_string also accepts (same ' - ' split);
+# anything else falls back to parse_availability_string.
+_INTERVAL_PATTERN = (
+    r'^(\d{1,2}):(\d{2})\s*(am|pm) - (\d{1,2}):(\d{2})\s*(am|pm)$'
+)
+
+
+@functools.lru_cache(maxsize=512)
 def parse_time_string(time_str: str) -> time:
     """
     Parse a formatted time string to a time object.
@@ -39,27 +58,27 @@ def parse_time_string(time_str: str) -> time:
     """
     time_str = time_str.strip().lower()
     
-    # Match patterns like "7:00 pm" or "11:30 am"
-    match = re.match(r'(\d{1,2}):(\d{2})\s*(am|pm)', time_str)
+    # Split "7:00 pm" / "11:30am" by hand: H or HH, ':', MM, optional
+    # whitespace, then am/pm (anything after the meridiem is ignored)
+    hour_str, _, rest = time_str.partition(':')
+    minute_str = rest[:2]
+    meridiem = rest[2:].lstrip()[:2]
     
-    if not match:
+    if not (0 < len(hour_str) <= 2 and hour_str.isdecimal()
+            and len(minute_str) == 2 and minute_str.isdecimal()
+            and meridiem in ('am', 'pm')):
         raise ValueError(f"Cannot parse time string: {time_str}")
     
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-    meridiem = match.group(3)
+    hours = int(hour_str)
+    minutes = int(minute_str)
     
     # Convert to 24-hour format
-    if meridiem == 'am':
-        if hours == 12:
-            hours = 0  # 12:00 am = midnight
-    else:  # pm
-        if hours != 12:
-            hours += 12  # Convert to 24-hour (but 12 pm stays 12)
+    hours += _HOUR_OFFSETS[meridiem, hours == 12]
     
     return time(hours, minutes)
 
 
+@functools.lru_cache(maxsize=512)
 def parse_interval_string(interval_str: str) -> TimeInterval:
     """
     Parse a single interval string to TimeInterval.
@@ -121,6 +140,13 @@ def parse_availability_string(availability_str: str) -> List[TimeInterval]:
     if not availability_str or availability_str.strip() == '':
         return []
     
+    # Fresh list per call; the cached tuple is shared
+    return list(_parse_availability_cached(availability_str))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_availability_cached(availability_str: str) -> Tuple[TimeInterval, ...]:
+    """Cached core of parse_availability_string; members often share schedules."""
     # Split on comma
     interval_strings = availability_str.split(',')
     
@@ -130,7 +156,83 @@ def parse_availability_string(availability_str: str) -> List[TimeInterval]:
         if interval_str:
             intervals.append(parse_interval_string(interval_str))
     
-    return intervals
+    return tuple(intervals)
+
+
+def parse_availability_column(series, errors: str = 'raise') -> List[List[TimeInterval]]:
+    """
+    Parse a pandas Series of availability strings in one vectorised pass.
+    
+    Gives the same result as applying parse_availability_string to each
+    element. Common "7:00 pm - 8:30 pm" pieces are split, regex-extracted
+    and converted to 24-hour time as pandas column operations; rows with
+    any piece the regex misses are handed to parse_availability_string.
+    
+    Args:
+        series: pandas Series of formatted availability strings
+        errors: 'raise' to raise ValueError on an unparseable entry,
+            'empty' to give that row no availability instead
+        
+    Returns:
+        List of TimeInterval lists, one per row in series order
+        
+    Raises:
+        ValueError: If errors='raise' and an entry cannot be parsed
+        
+    Examples:
+        >>> parse_availability_column(pd.Series(["7:00 pm - 8:00 pm", ""]))
+        [[TimeInterval(start=time(19, 0), end=time(20, 0))], []]
+    """
+    if errors not in ('raise', 'empty'):
+        raise ValueError(f"errors must be 'raise' or 'empty', got {errors!r}")
+    
+    result = [[] for _ in range(len(series))]
+    
+    # Index by position so exploded pieces map back to result rows
+    values = series.reset_index(drop=True).fillna('').astype(str)
+    pieces = (
+        values
+        .str.lower()
+        .str.split(',')
+        .explode()
+        .str.strip()
+    )
+    pieces = pieces[pieces != '']
+    
+    parts = pieces.str.extract(_INTERVAL_PATTERN)
+    fallback = set(parts.index[parts[0].isna()])
+    parts = parts[~parts.index.isin(fallback)]
+    
+    # 24-hour conversion, same offsets as _HOUR_OFFSETS
+    start_h = parts[0].astype(int)
+    end_h = parts[3].astype(int)
+    start_h += (parts[2] == 'pm') * 12 - (start_h == 12) * 12
+    end_h += (parts[5] == 'pm') * 12 - (end_h == 12) * 12
+    
+    failed = set()
+    for pos, sh, sm, eh, em in zip(
+        parts.index, start_h, parts[1].astype(int), end_h, parts[4].astype(int)
+    ):
+        if pos in failed:
+            continue
+        try:
+            result[pos].append(TimeInterval(time(sh, sm), time(eh, em)))
+        except ValueError:
+            if errors == 'raise':
+                raise
+            failed.add(pos)
+    
+    for pos in failed:
+        result[pos] = []
+    
+    for pos in sorted(fallback):
+        try:
+            result[pos] = parse_availability_string(values[pos])
+        except ValueError:
+            if errors == 'raise':
+                raise
+    
+    return result
 
 
 def does_duration_fit_in_intervals(
@@ -190,14 +292,60 @@ def find_best_fit_interval(
         >>> find_best_fit_interval(60, intervals)
         TimeInterval(start=time(14, 0), end=time(15, 30))  # Smallest that fits
     """
-    # Filter to intervals that can fit the duration
-    candidates = [
-        iv for iv in available_intervals 
-        if iv.duration_minutes() >= duration_minutes
-    ]
+    # Single pass: keep the smallest interval that fits (first one on ties)
+    best = None
+    best_duration = None
+    for iv in available_intervals:
+        d = iv.duration_minutes()
+        if d >= duration_minutes and (best_duration is None or d < best_duration):
+            best, best_duration = iv, d
     
-    if not candidates:
+    if best is None:
         raise ValueError(f"No interval large enough for {duration_minutes} minutes")
     
-    # Return smallest candidate (best fit)
-    return min(candidates, key=lambda iv: iv.duration_minutes())
\ No newline at end of file
+    return best
+
+
+class AvailabilityIndex:
+    """
+    Precomputed duration index over a fixed set of available intervals.
+    
+    Answers the same questions as does_duration_fit_in_intervals and
+    find_best_fit_interval, for callers that query one availability set
+    with many durations: fits() is O(1) and best_fit() is O(log n).
+    
+    Examples:
+        >>> index = AvailabilityIndex([
+        ...     TimeInterval(time(19, 0), time(21, 0)),  # 120 minutes
+        ...     TimeInterval(time(14, 0), time(15, 30))  # 90 minutes
+        ... ])
+        >>> index.fits(100)
+        True
+        >>> index.best_fit(60)
+        TimeInterval(start=time(14, 0), end=time(15, 30))
+    """
+    
+    def __init__(self, available_intervals: List[TimeInterval]):
+        # Stable sort keeps input order among equal durations, so best_fit
+        # picks the same interval as find_best_fit_interval
+        self._by_duration = sorted(
+            available_intervals, key=lambda iv: iv.duration_minutes()
+        )
+        self._durations = [iv.duration_minutes() for iv in self._by_duration]
+        self._max_duration = self._durations[-1] if self._durations else None
+    
+    def fits(self, duration_minutes: int) -> bool:
+        """Check if duration fits in at least one interval."""
+        return self._max_duration is not None and duration_minutes <= self._max_duration
+    
+    def best_fit(self, duration_minutes: int) -> TimeInterval:
+        """
+        Return the smallest interval that can accommodate the duration.
+        
+        Raises:
+            ValueError: If no interval is large enough
+        """
+        i = bisect_left(self._durations, duration_minutes)
+        if i == len(self._durations):
+            raise ValueError(f"No interval large enough for {duration_minutes} minutes")
+        return self._by_duration[i]
@@ -5,9 +5,13 @@ Provides core interval logic used throughout the scheduling system.
 """
 
 from datetime import date, time, datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union
 
+# strptime formats tried, in order, by parse_time_string / parse_date_string
+TIME_FORMATS = ('%I:%M %p', '%I %p', '%H:%M', '%H')
+DATE_FORMATS = ('%m/%d/%Y', '%m/%d/%y')
+
 # Utility functions
 
 def parse_time_to_military(time_value: Union[int, str]) -> int:
@@ -93,7 +97,7 @@ def parse_time_string(time_str: str) -> time:
     """
     time_str = time_str.strip()
     
-    for fmt in ['%I:%M %p', '%I %p', '%H:%M', '%H']:
+    for fmt in TIME_FORMATS:
         try:
             return datetime.strptime(time_str, fmt).time()
         except ValueError:
@@ -121,7 +125,7 @@ def parse_date_string(date_str: str) -> date:
     """
     date_str = date_str.strip()
     
-    for fmt in ['%m/%d/%Y', '%m/%d/%y']:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).date()
         except ValueError:
@@ -130,6 +134,19 @@ def parse_date_string(date_str: str) -> date:
     raise ValueError(f"Cannot parse date: {date_str}")
 
 
+def military_to_time(military: int) -> time:
+    """
+    Convert a military time integer to a time object.
+    
+    Inverse of parse_time_to_military for integers.
+    
+    Examples:
+        >>> military_to_time(1815)
+        time(18, 15)
+    """
+    return time(military // 100, military % 100)
+
+
 def time_to_minutes(t: time) -> int:
     """
     Convert a time object to minutes since midnight.
@@ -147,7 +164,7 @@ def time_to_minutes(t: time) -> int:
     return t.hour * 60 + t.minute
 
     
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimeInterval:
     """
     Represents a time range within a single day.
@@ -156,14 +173,35 @@ class TimeInterval:
     """
     start: time
     end: time
+    # Minutes since midnight, derived in __post_init__; not part of eq/hash
+    _start_min: int = field(init=False, repr=False, compare=False)
+    _end_min: int = field(init=False, repr=False, compare=False)
+    _duration: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.start >= self.end:
-            raise ValueError(f"Start time {self.start} must be before end time {self.end}")
+        start, end = self.start, self.end
+        if start >= end:
+            raise ValueError(f"Start time {start} must be before end time {end}")
+        # Fields are immutable, so minutes since midnight are computed once
+        start_min = start.hour * 60 + start.minute
+        end_min = end.hour * 60 + end.minute
+        object.__setattr__(self, '_start_min', start_min)
+        object.__setattr__(self, '_end_min', end_min)
+        object.__setattr__(self, '_duration', end_min - start_min)
+    
+    @property
+    def start_min(self) -> int:
+        """Start as minutes since midnight."""
+        return self._start_min
+    
+    @property
+    def end_min(self) -> int:
+        """End as minutes since midnight."""
+        return self._end_min
     
     def overlaps(self, other: 'TimeInterval') -> bool:
         """Check if this interval overlaps with another."""
-        return self.start < other.end and other.start < self.end
+        return self._start_min < other._end_min and other._start_min < self._end_min
     
     def contains_time(self, t: time) -> bool:
         """Check if a specific time falls within this interval."""
@@ -171,9 +209,7 @@ class TimeInterval:
     
     def duration_minutes(self) -> int:
         """Calculate duration in minutes."""
-        start_mins = self.start.hour * 60 + self.start.minute
-        end_mins = self.end.hour * 60 + self.end.minute
-        return end_mins - start_mins
+        return self._duration
     
     @classmethod
     def from_strings(cls, start_str: str, end_str: str) -> 'TimeInterval':
@@ -183,6 +219,16 @@ class TimeInterval:
         Supports formats: "2:30 PM", "14:30"
         """
         return cls(parse_time_string(start_str), parse_time_string(end_str))
+    
+    @classmethod
+    def from_military(cls, start: int, end: int) -> 'TimeInterval':
+        """
+        Create TimeInterval from military time integers, e.g. 1400, 1530.
+        
+        Constraints and rehearsal slots carry military time, so this is
+        the single place those ints become time objects.
+        """
+        return cls(military_to_time(start), military_to_time(end))
 
 
 @dataclass(frozen=True)
@@ -7,10 +7,17 @@ business logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 
 
+# Read-only OAuth scopes for GoogleSheetsDataSource
+SHEETS_SCOPES = (
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.readonly',
+)
+
+
 class DataSource(ABC):             # pragma: no cover
     """Abstract base class for data sources."""
     
@@ -25,6 +32,20 @@ class DataSource(ABC):             # pragma: no cover
         """
         pass
     
+    def read_dataframe(self):
+        """
+        Read all records from the data source as a pandas DataFrame.
+        
+        Columnar alternative to read_records() for callers that process
+        whole columns. Sources with a native bulk reader override this.
+        
+        Returns:
+            DataFrame with one row per record
+        """
+        import pandas as pd
+        
+        return pd.DataFrame(self.read_records())
+    
     @abstractmethod
     def get_source_name(self) -> str:
         """Get a human-readable name for this data source."""
@@ -45,11 +66,39 @@ class CSVDataSource(DataSource):
     
     def read_records(self) -> List[Dict[str, Any]]:
         """Read records from CSV file."""
+        return self.read_dataframe().to_dict('records')
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from CSV file one row at a time.
+        
+        Same rows as read_records() without holding the whole file in
+        memory; the file stays open until the iterator is exhausted.
+        """
         import csv
         
-        with open(self.filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        with open(self.filepath, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    
+    def read_dataframe(self):
+        """
+        Read CSV file with pandas' C parser.
+        
+        All cells are kept as strings, with empty cells as '' (not NaN)
+        to match csv.DictReader.
+        """
+        import pandas as pd
+        
+        try:
+            return pd.read_csv(
+                self.filepath,
+                engine='c',
+                dtype=str,
+                keep_default_na=False,
+                encoding='utf-8'
+            )
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
     
     def get_source_name(self) -> str:
         """Return the filename."""
@@ -78,6 +127,9 @@ class GoogleSheetsDataSource(DataSource):
         self.worksheet = worksheet
         self._sheet_title = None
         self._worksheet_title = None
+        # Authorized client and opened spreadsheet, reused across reads
+        self._client = None
+        self._sheet = None
     
     def read_records(self) -> List[Dict[str, Any]]:
         """Read records from Google Sheet."""
@@ -90,23 +142,22 @@ class GoogleSheetsDataSource(DataSource):
                 "Install with: pip install gspread google-auth"
             )
         
-        # Authenticate
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets.readonly',
-            'https://www.googleapis.com/auth/drive.readonly'
-        ]
-        creds = Credentials.from_service_account_file(
-            str(self.credentials_path), 
-            scopes=scopes
-        )
-        client = gspread.authorize(creds)
-        
-        # Open sheet
-        if self.sheet_id_or_url.startswith('http'):
-            sheet = client.open_by_url(self.sheet_id_or_url)
-        else:
-            sheet = client.open_by_key(self.sheet_id_or_url)
+        # Authenticate once per instance
+        if self._client is None:
+            creds = Credentials.from_service_account_file(
+                str(self.credentials_path), 
+                scopes=list(SHEETS_SCOPES)
+            )
+            self._client = gspread.authorize(creds)
+        
+        # Open sheet once per instance
+        if self._sheet is None:
+            if self.sheet_id_or_url.startswith('http'):
+                self._sheet = self._client.open_by_url(self.sheet_id_or_url)
+            else:
+                self._sheet = self._client.open_by_key(self.sheet_id_or_url)
         
+        sheet = self._sheet
         self._sheet_title = sheet.title
         
         # Get worksheet
@@ -6,18 +6,85 @@ Data loader for rehearsal scheduling - reads from Google Sheets into pandas Data
 Provides a unified interface for loading scheduling data regardless of source.
 """
 
+import copy
+import functools
+import json
 import os
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 import yaml
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+# The Google client stack is slow to import; it is loaded on first use so
+# load_from_csv callers never pay for it
+if TYPE_CHECKING:
+    from google_auth_httplib2 import AuthorizedHttp
 
 
 CREDENTIALS_PATH = os.getenv('GOOGLE_BUILDER_CREDENTIALS') or os.getenv('GOOGLE_TEST_CREDENTIALS')
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
+# Only requested when the disk cache is on, for spreadsheet version lookups
+CACHE_SCOPES = SCOPES + ['https://www.googleapis.com/auth/drive.metadata.readonly']
+
+
+# Column dtypes per load_* method. Cells arrive as text and are built
+# into object frames, so these are applied once instead of letting pandas
+# infer a type per column on every load. Columns not listed stay object.
+_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'rehearsals': {
+        'rehearsal_id': 'str', 'venue_id': 'str', 'venue_name': 'str',
+        'date': 'str', 'weekday': 'str', 'start_time': 'str', 'end_time': 'str',
+    },
+    'rd_constraints': {'rd_id': 'str', 'full_name': 'str', 'constraints': 'str'},
+    'dancer_constraints': {'dancer_id': 'str', 'full_name': 'str', 'constraints': 'str'},
+    'dance_groups': {
+        'dg_id': 'str', 'dg_name': 'str', 'current_rd': 'str', 'current_rd_name': 'str',
+    },
+    'dance_cast': {'dancer_id': 'str'},
+    'group_cast': {'dancer_id': 'str'},
+    'dances': {'dance_id': 'str'},
+    'dancers': {'dancer_id': 'str'},
+    'allotted': {'rd_id': 'str', 'rd_name': 'str', 'dg_id': 'str', 'dg_name': 'str'},
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(config_path: str) -> dict:
+    """Parse a loader YAML config once per process."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_service(credentials_path: str, scopes: Tuple[str, ...] = tuple(SCOPES)):
+    """
+    Build credentials and a Sheets service once per credentials file and scopes.
+    
+    Returns:
+        Tuple of (credentials, service)
+    """
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+    
+    creds = Credentials.from_service_account_file(credentials_path, scopes=list(scopes))
+    return creds, build('sheets', 'v4', credentials=creds, cache_discovery=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_drive_service(credentials_path: str):
+    """Build a Drive service (for file metadata) once per credentials file."""
+    from googleapiclient.discovery import build
+    
+    creds, _ = _build_service(credentials_path, tuple(CACHE_SCOPES))
+    return build('drive', 'v3', credentials=creds, cache_discovery=False)
 
 
 class SchedulingDataLoader:
@@ -27,22 +94,30 @@ class SchedulingDataLoader:
     Provides consistent DataFrame structure regardless of source.
     """
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, cache_dir: Optional[str] = None):
         """
         Initialize loader with configuration.
         
         Args:
             config_path: Path to YAML config with workbook IDs and sheet names
+            cache_dir: Optional directory for caching batch-read sheets on
+                disk; reused while the spreadsheet's Drive version is unchanged
         """
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # Private copy so the cached parse can't be changed through a loader
+        self.config = copy.deepcopy(_load_config(str(config_path)))
         
         self.workbooks = self.config.get('workbooks', {})
         self.sheets = self.config.get('sheets', {})
         
         # Initialize Google Sheets service
-        creds = Credentials.from_service_account_file(CREDENTIALS_PATH, scopes=SCOPES)
-        self.service = build('sheets', 'v4', credentials=creds)
+        scopes = CACHE_SCOPES if self.cache_dir else SCOPES
+        self.credentials, self.service = _build_service(CREDENTIALS_PATH, tuple(scopes))
+        
+        # Frames prefetched by load_all, keyed by (spreadsheet_id, sheet_name);
+        # each is handed out once by _read_sheet_to_df
+        self._sheet_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
     
     def _read_sheet_to_df(self, spreadsheet_id: str, sheet_name: str) -> pd.DataFrame:
         """
@@ -55,13 +130,119 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with data from sheet
         """
+        cached = self._sheet_cache.pop((spreadsheet_id, sheet_name), None)
+        if cached is not None:
+            return cached
+        
+        # A bare sheet name is trimmed by the API to the populated cells
         result = self.service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
-            range=f"{sheet_name}!A1:ZZ"
+            range=sheet_name
         ).execute()
         
-        values = result.get('values', [])
+        return self._values_to_df(result.get('values', []))
+    
+    def _batch_read(
+        self,
+        spreadsheet_id: str,
+        sheet_names: List[str],
+        http: Optional['AuthorizedHttp'] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Read several sheets of one workbook in a single batchGet request.
         
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            sheet_names: Names of sheets to read
+            http: Transport to use instead of the service's own; needed
+                when called from another thread (httplib2 is not thread-safe)
+            
+        Returns:
+            Dictionary mapping sheet name to DataFrame
+        """
+        version = None
+        if self.cache_dir:
+            # Cheap metadata call; version changes on every edit
+            version = _build_drive_service(CREDENTIALS_PATH).files().get(
+                fileId=spreadsheet_id,
+                fields='version'
+            ).execute(http=http)['version']
+            
+            cached = self._read_disk_cache(spreadsheet_id, version, sheet_names)
+            if cached is not None:
+                return cached
+        
+        result = self.service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=list(sheet_names)
+        ).execute(http=http)
+        
+        # valueRanges come back in request order
+        frames = {
+            name: self._values_to_df(value_range.get('values', []))
+            for name, value_range in zip(sheet_names, result.get('valueRanges', []))
+        }
+        
+        if self.cache_dir:
+            self._write_disk_cache(spreadsheet_id, version, frames)
+        
+        return frames
+    
+    def _read_disk_cache(
+        self,
+        spreadsheet_id: str,
+        version: str,
+        sheet_names: List[str]
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Load sheets from the disk cache if it holds all of them at this version.
+        
+        Returns:
+            Dictionary mapping sheet name to DataFrame, or None on a miss
+        """
+        workbook_dir = self.cache_dir / spreadsheet_id
+        try:
+            index = json.loads((workbook_dir / 'index.json').read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        
+        files = index.get('sheets', {})
+        if index.get('version') != version or not all(name in files for name in sheet_names):
+            return None
+        
+        # A listed file that is missing or truncated is a miss, not an error
+        try:
+            return {name: pd.read_pickle(workbook_dir / files[name]) for name in sheet_names}
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            return None
+    
+    def _write_disk_cache(
+        self,
+        spreadsheet_id: str,
+        version: str,
+        frames: Dict[str, pd.DataFrame]
+    ):
+        """Store freshly read sheets with the version they were read at."""
+        workbook_dir = self.cache_dir / spreadsheet_id
+        workbook_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Sheet names can hold any character, so files are numbered
+        files = {name: f"{i}.pkl" for i, name in enumerate(frames)}
+        for name, df in frames.items():
+            df.to_pickle(workbook_dir / files[name])
+        
+        # Index last, so a partial write is never seen as current
+        (workbook_dir / 'index.json').write_text(
+            json.dumps({'version': version, 'sheets': files})
+        )
+    
+    @staticmethod
+    def _values_to_df(values: list) -> pd.DataFrame:
+        """
+        Build a DataFrame from a Sheets API values array.
+        
+        First row is the header; shorter rows are padded with ''.
+        """
         if not values or len(values) < 2:
             return pd.DataFrame()
         
@@ -69,11 +250,58 @@ class SchedulingDataLoader:
         header = values[0]
         data = values[1:]
         
-        # Pad rows to match header length
+        # Pad rows to match header length by copying each row into a
+        # '' filled 2-D buffer; pandas takes the ndarray as one block
         max_cols = len(header)
-        padded_data = [row + [''] * (max_cols - len(row)) for row in data]
+        grid = np.full((len(data), max_cols), '', dtype=object)
+        for i, row in enumerate(data):
+            row = row[:max_cols]
+            grid[i, :len(row)] = row
+        
+        # dtype=object skips per-column inference; see _read_typed
+        return pd.DataFrame(grid, columns=header, dtype=object)
+    
+    def _read_typed(self, workbook: str, sheet_name: str, schema_name: str) -> pd.DataFrame:
+        """
+        Read a sheet and apply its _SCHEMAS dtypes in one astype.
+        
+        Args:
+            workbook: Key into the config workbooks ('scheduling', 'lookup_tables')
+            sheet_name: Sheet (tab) name
+            schema_name: Key into _SCHEMAS
+        """
+        df = self._read_sheet_to_df(self.workbooks[workbook], sheet_name)
+        
+        schema = _SCHEMAS[schema_name]
+        return df.astype({col: dtype for col, dtype in schema.items() if col in df.columns})
+    
+    @staticmethod
+    def _matrix_grid(df: pd.DataFrame, dense: bool = True) -> pd.DataFrame:
+        """
+        Slice a cast matrix sheet down to its 1/0 grid.
+        
+        Column headers past 'dancer_id' and 'full_name' are the grid IDs;
+        row 0 holds display names and is skipped.
+        
+        Args:
+            df: Raw matrix sheet
+            dense: If False, store cells as Sparse[int8, 0] (only the 1s)
         
-        return pd.DataFrame(padded_data, columns=header)
+        Returns:
+            int8 DataFrame with dancer_id index
+        """
+        # Slice the ndarray once rather than copying the whole frame
+        cells = df.values[1:, 2:]
+        
+        # 1/0 membership as int8 in one vectorised compare
+        grid = pd.DataFrame(
+            np.where(cells == '1', 1, 0).astype(np.int8),
+            index=pd.Index(df['dancer_id'].iloc[1:], name='dancer_id'),
+            columns=df.columns[2:]
+        )
+        
+        # Each dancer is in a handful of dances, so most cells are 0
+        return grid if dense else grid.astype(pd.SparseDtype(np.int8, 0))
     
     def load_rehearsals(self) -> pd.DataFrame:
         """
@@ -82,10 +310,9 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with columns: rehearsal_id, venue_id, venue_name, date, weekday, start_time, end_time
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling']['rehearsals']
         
-        return self._read_sheet_to_df(scheduling_id, sheet_name)
+        return self._read_typed('scheduling', sheet_name, 'rehearsals')
     
     def load_rd_constraints(self) -> pd.DataFrame:
         """
@@ -94,10 +321,9 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with columns: rd_id, full_name, constraints, (optional: ai_translation, raw_constraints_from_form)
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling']['rd_constraints']
         
-        return self._read_sheet_to_df(scheduling_id, sheet_name)
+        return self._read_typed('scheduling', sheet_name, 'rd_constraints')
     
     def load_dancer_constraints(self) -> pd.DataFrame:
         """
@@ -106,35 +332,36 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with columns: dancer_id, full_name, constraints, (optional: ai_translation, raw_constraints_from_form)
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling']['dancer_constraints']
         
-        return self._read_sheet_to_df(scheduling_id, sheet_name)
+        return self._read_typed('scheduling', sheet_name, 'dancer_constraints')
     
     def load_dance_groups(self) -> pd.DataFrame:
         """
         Load dance group assignments.
         
         Returns:
-            DataFrame with columns: dance_id, group_id
+            DataFrame with columns: dg_id, dg_name, current_rd, current_rd_name
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling'].get('dance_groups', 'dance_groups')
         
-        return self._read_sheet_to_df(scheduling_id, sheet_name)
+        return self._read_typed('scheduling', sheet_name, 'dance_groups')
 
 
-    def load_dance_cast(self) -> pd.DataFrame:
+    def load_dance_cast(self, dense: bool = True) -> pd.DataFrame:
         """
         Load dance casting matrix.
         
+        Args:
+            dense: If False, return the cells as Sparse[int8, 0]
+        
         Returns:
-            DataFrame with dance_ids as columns, dancer_ids as index
+            DataFrame with dance_ids as columns, dancer_ids as index,
+            int8 cells (1 if dancer is in dance, else 0)
         """
-        lookup_id = self.workbooks['lookup_tables']
         sheet_name = self.sheets['lookup_tables'].get('dance_cast', 'dance_cast')
         
-        df = self._read_sheet_to_df(lookup_id, sheet_name)
+        df = self._read_typed('lookup_tables', sheet_name, 'dance_cast')
         
         # Sheet structure:
         # Row 1 (header): dancer_id, full_name, d_01, d_02, d_03, ...
@@ -144,20 +371,7 @@ class SchedulingDataLoader:
         if df.empty or len(df) < 2:
             return pd.DataFrame()
         
-        # Dance IDs are already in the column headers! (columns 2+)
-        dance_ids = df.columns[2:]  # Skip 'dancer_id' and 'full_name'
-        
-        # Skip row 0 (dance names row), start from row 1 (first dancer)
-        data_rows = df.iloc[1:].copy()
-        
-        # Set dancer_id as index
-        data_rows.index = data_rows['dancer_id']
-        data_rows.index.name = 'dancer_id'
-        
-        # Keep only the dance columns (drop dancer_id and full_name)
-        grid = data_rows[dance_ids]
-        
-        return grid    
+        return self._matrix_grid(df, dense)
 
 
     def load_dances(self) -> pd.DataFrame:
@@ -167,10 +381,9 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with dance details
         """
-        lookup_id = self.workbooks['lookup_tables']
         sheet_name = self.sheets['lookup_tables'].get('dances', 'dances')
         
-        return self._read_sheet_to_df(lookup_id, sheet_name)
+        return self._read_typed('lookup_tables', sheet_name, 'dances')
     
 
     def load_dancers(self) -> pd.DataFrame:
@@ -180,23 +393,25 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with dancer details
         """
-        lookup_id = self.workbooks['lookup_tables']
         sheet_name = self.sheets['lookup_tables'].get('dancers', 'dancers')
         
-        return self._read_sheet_to_df(lookup_id, sheet_name)
+        return self._read_typed('lookup_tables', sheet_name, 'dancers')
     
 
-    def load_group_cast(self) -> pd.DataFrame:
+    def load_group_cast(self, dense: bool = True) -> pd.DataFrame:
         """
         Load group casting matrix (Scheduling workbook version).
         
+        Args:
+            dense: If False, return the cells as Sparse[int8, 0]
+        
         Returns:
-            DataFrame in matrix format with dancer_ids as index, dg_ids as columns
+            DataFrame in matrix format with dancer_ids as index, dg_ids as columns,
+            int8 cells (1 if dancer is in group, else 0)
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling'].get('group_cast', 'group_cast')
         
-        df = self._read_sheet_to_df(scheduling_id, sheet_name)
+        df = self._read_typed('scheduling', sheet_name, 'group_cast')
         
         # Same matrix format as dance_cast:
         # Row 0: dg_ids (d_01_g_01, d_02, etc.) starting at column C (index 2)
@@ -205,20 +420,7 @@ class SchedulingDataLoader:
         if df.empty or len(df) < 2:
             return pd.DataFrame()
         
-        # Dance group IDs are in column headers (row 1 of sheet became headers)
-        dg_ids = df.columns[2:]  # Skip 'dancer_id' and 'full_name'
-        
-        # Skip row 0 (which has group names for reference), start from row 1
-        data_rows = df.iloc[1:].copy()
-        
-        # Set dancer_id as index
-        data_rows.index = data_rows['dancer_id']
-        data_rows.index.name = 'dancer_id'
-        
-        # Keep only the group columns (drop dancer_id and full_name)
-        grid = data_rows[dg_ids]
-        
-        return grid
+        return self._matrix_grid(df, dense)
 
 
     def load_allotted(self) -> pd.DataFrame:
@@ -228,10 +430,9 @@ class SchedulingDataLoader:
         Returns:
             DataFrame with columns: rd_id, rd_name, minutes, dg_id, dg_name
         """
-        scheduling_id = self.workbooks['scheduling']
         sheet_name = self.sheets['scheduling'].get('allotted', 'allotted')
         
-        df = self._read_sheet_to_df(scheduling_id, sheet_name)
+        df = self._read_typed('scheduling', sheet_name, 'allotted')
         
         if df.empty:
             return pd.DataFrame()
@@ -244,13 +445,71 @@ class SchedulingDataLoader:
 
     
 
+    def _sheets_by_workbook(self) -> Dict[str, List[str]]:
+        """
+        Sheet names read by load_all, grouped by spreadsheet ID.
+        
+        Uses the same name lookups as the individual load_* methods.
+        """
+        scheduling = self.sheets['scheduling']
+        lookup = self.sheets['lookup_tables']
+        
+        # Both workbook keys may name the same spreadsheet
+        by_workbook: Dict[str, List[str]] = {}
+        by_workbook.setdefault(self.workbooks['scheduling'], []).extend([
+            scheduling['rehearsals'],
+            scheduling['rd_constraints'],
+            scheduling['dancer_constraints'],
+            scheduling.get('dance_groups', 'dance_groups'),
+            scheduling.get('group_cast', 'group_cast'),
+            scheduling.get('allotted', 'allotted'),
+        ])
+        by_workbook.setdefault(self.workbooks['lookup_tables'], []).extend([
+            lookup.get('dance_cast', 'dance_cast'),
+            lookup.get('dances', 'dances'),
+            lookup.get('dancers', 'dancers'),
+        ])
+        
+        return by_workbook
+    
     def load_all(self) -> Dict[str, pd.DataFrame]:
         """
         Load all scheduling data.
         
+        Fetches each workbook with one batchGet, with the workbook requests
+        in flight concurrently, then builds the frames through the
+        individual load_* methods.
+        
         Returns:
             Dictionary mapping data type to DataFrame
         """
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        
+        workbooks = self._sheets_by_workbook()
+        
+        with ThreadPoolExecutor(max_workers=len(workbooks)) as executor:
+            futures = {
+                spreadsheet_id: executor.submit(
+                    self._batch_read,
+                    spreadsheet_id,
+                    sheet_names,
+                    AuthorizedHttp(self.credentials, http=httplib2.Http())
+                )
+                for spreadsheet_id, sheet_names in workbooks.items()
+            }
+        
+        for spreadsheet_id, future in futures.items():
+            for name, df in future.result().items():
+                self._sheet_cache[(spreadsheet_id, name)] = df
+        
+        try:
+            return self._load_all_frames()
+        finally:
+            self._sheet_cache.clear()
+    
+    def _load_all_frames(self) -> Dict[str, pd.DataFrame]:
+        """Run every load_* method (from the prefetch cache when filled)."""
         return {
             'rehearsals': self.load_rehearsals(),
             'rd_constraints': self.load_rd_constraints(),
@@ -264,6 +523,26 @@ class SchedulingDataLoader:
         }
 
 
+def _read_csv(path: Path) -> pd.DataFrame:
+    """read_csv with the C parser, which releases the GIL while tokenizing."""
+    return pd.read_csv(path, engine='c')
+
+
+def _read_cast_csv(path: Path) -> pd.DataFrame:
+    """
+    Read an exported cast matrix CSV into the loader's int8 grid.
+    
+    Exports keep the sheet's dance-name row under the header, so the file
+    is read as text and sliced by the same _matrix_grid step as the sheet.
+    """
+    df = pd.read_csv(path, engine='c', dtype=str, keep_default_na=False)
+    
+    if df.empty or len(df) < 2:
+        return pd.DataFrame()
+    
+    return SchedulingDataLoader._matrix_grid(df)
+
+
 def load_from_csv(data_dir: str) -> Dict[str, pd.DataFrame]:
     """
     Load scheduling data from CSV files.
@@ -278,16 +557,27 @@ def load_from_csv(data_dir: str) -> Dict[str, pd.DataFrame]:
     """
     data_path = Path(data_dir)
     
-    return {
-        'rehearsals': pd.read_csv(data_path / 'rehearsals.csv'),
-        'rd_constraints': pd.read_csv(data_path / 'rd_constraints.csv'),
-        'dancer_constraints': pd.read_csv(data_path / 'dancer_constraints.csv'),
-        'dance_groups': pd.read_csv(data_path / 'dance_groups.csv'),
-        'dance_cast': pd.read_csv(data_path / 'dance_cast.csv', index_col=0),  # dancer_id as index
-        'dances': pd.read_csv(data_path / 'dances.csv'),
-        'dancers': pd.read_csv(data_path / 'dancers.csv'),
-        'rds': pd.read_csv(data_path / 'rds.csv'),
+    # Reader per file
+    readers = {
+        'rehearsals': _read_csv,
+        'rd_constraints': _read_csv,
+        'dancer_constraints': _read_csv,
+        'dance_groups': _read_csv,
+        'dance_cast': _read_cast_csv,  # int8 grid, dancer_id as index
+        'dances': _read_csv,
+        'dancers': _read_csv,
+        'rds': _read_csv,
     }
+    
+    # The C parser drops the GIL while tokenizing, so the files parse in
+    # parallel on separate threads
+    with ThreadPoolExecutor(max_workers=len(readers)) as executor:
+        futures = {
+            name: executor.submit(reader, data_path / f"{name}.csv")
+            for name, reader in readers.items()
+        }
+    
+    return {name: future.result() for name, future in futures.items()}
 
 
 if __name__ == '__main__':
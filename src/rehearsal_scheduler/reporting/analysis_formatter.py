@@ -4,8 +4,22 @@ Formatters for analysis reports.
 Handles display of time analysis and conflict reports.
 """
 
+import heapq
 import sys
-from typing import TextIO
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, TextIO
+
+# Dot-leader labels for the section totals; fixed text, so built once
+_TOTAL_REQUESTED = f"{'TOTAL REQUESTED:':.<50}"
+_TOTAL_AVAILABLE = f"{'TOTAL AVAILABLE:':.<50}"
+
+# Column order of ConflictReportFormatter.write_csv rows
+_CONFLICT_CSV_HEADER = (
+    'rhd_id', 'venue', 'day', 'date', 'time_slot',
+    'conflicting_constraints', 'affected_dances'
+)
 
 
 class TimeAnalysisFormatter:
@@ -22,101 +36,115 @@ class TimeAnalysisFormatter:
         self.output = output_stream or sys.stdout
         self.errors = error_stream or sys.stderr
     
-    def display_analysis(self, result):
+    def display_analysis(
+        self,
+        result,
+        top_k: Optional[int] = None,
+        top_dances_per_director: Optional[int] = None
+    ):
         """
         Display formatted time analysis.
         
         Args:
             result: TimeAnalysisResult object
+            top_k: Show only the first top_k directors (by ID); None for all
+            top_dances_per_director: Show at most this many dances per
+                director; None for all
         """
-        self.output.write("=" * 70 + "\n")
-        self.output.write("REHEARSAL TIME ANALYSIS\n")
-        self.output.write("=" * 70 + "\n")
+        # Sections append to one buffer, written with a single call
+        parts = ["=" * 70 + "\n", "REHEARSAL TIME ANALYSIS\n", "=" * 70 + "\n"]
         
         # Requested time
-        self._display_requested_time(result)
+        self._display_requested_time(result, parts, top_k, top_dances_per_director)
         
         # Available time
-        self._display_available_time(result)
+        self._display_available_time(result, parts)
         
         # Comparison
-        self._display_comparison(result)
+        self._display_comparison(result, parts)
         
-        self.output.write("=" * 70 + "\n")
+        parts.append("=" * 70 + "\n")
+        self.output.write(''.join(parts))
         self.output.flush()
     
-    def _display_requested_time(self, result):
-        """Display requested time section."""
-        self.output.write("\n📋 TIME REQUESTED\n")
-        self.output.write("-" * 70 + "\n")
-        
-        for rhd_id, data in sorted(result.requests_by_director.items()):
-            self.output.write(
-                f"\n{rhd_id}: {data['total']:.0f} minutes "
-                f"({data['total']/60:.1f} hours)\n"
+    def _display_requested_time(self, result, parts, top_k=None, top_dances=None):
+        """Append requested time section to parts."""
+        parts += ["\n📋 TIME REQUESTED\n", "-" * 70 + "\n"]
+        
+        directors = result.requests_by_director.items()
+        if top_k is None:
+            directors = sorted(directors)
+        else:
+            # Partial sort: only the shown directors are ordered
+            directors = heapq.nsmallest(top_k, directors, key=itemgetter(0))
+        
+        for rhd_id, data in directors:
+            total = data['total']
+            parts.append(f"\n{rhd_id}: {total:.0f} minutes ({total/60:.1f} hours)\n")
+            dances = data['dances']
+            parts.extend(
+                f"  • {dance['number_id']}: {dance['minutes']:.0f} min\n"
+                for dance in islice(dances, top_dances)
             )
-            for dance in data['dances']:
-                self.output.write(
-                    f"  • {dance['number_id']}: {dance['minutes']:.0f} min\n"
-                )
+            if top_dances is not None and len(dances) > top_dances:
+                parts.append(f"  • … {len(dances) - top_dances} more\n")
         
         if result.missing_requests:
-            self.output.write(
+            parts.append(
                 f"\n⚠ Missing time requests: {', '.join(result.missing_requests)}\n"
             )
         
-        self.output.write(
-            f"\n{'TOTAL REQUESTED:':.<50} {result.total_requested:.0f} min "
-            f"({result.total_requested/60:.1f} hrs)\n"
+        requested = result.total_requested
+        parts.append(
+            f"\n{_TOTAL_REQUESTED} {requested:.0f} min ({requested/60:.1f} hrs)\n"
         )
     
-    def _display_available_time(self, result):
-        """Display available time section."""
-        self.output.write("\n\n🏢 VENUE AVAILABILITY\n")
-        self.output.write("-" * 70 + "\n")
-        
-        for slot in result.venue_slots:
-            self.output.write(f"\n{slot['venue']} - {slot['day']}, {slot['date']}\n")
-            self.output.write(f"  {slot['start']} - {slot['end']}\n")
-            self.output.write(
-                f"  Duration: {slot['duration']} min "
-                f"({slot['duration']/60:.1f} hrs)\n"
-            )
+    def _display_available_time(self, result, parts):
+        """Append available time section to parts."""
+        parts += ["\n\n🏢 VENUE AVAILABILITY\n", "-" * 70 + "\n"]
+        
+        parts.extend(
+            f"\n{slot['venue']} - {slot['day']}, {slot['date']}\n"
+            f"  {slot['start']} - {slot['end']}\n"
+            f"  Duration: {slot['duration']} min "
+            f"({slot['duration']/60:.1f} hrs)\n"
+            for slot in result.venue_slots
+        )
         
-        self.output.write(
-            f"\n{'TOTAL AVAILABLE:':.<50} {result.total_available:.0f} min "
-            f"({result.total_available/60:.1f} hrs)\n"
+        available = result.total_available
+        parts.append(
+            f"\n{_TOTAL_AVAILABLE} {available:.0f} min ({available/60:.1f} hrs)\n"
         )
     
-    def _display_comparison(self, result):
-        """Display comparison section."""
-        self.output.write("\n\n⚖️  COMPARISON\n")
-        self.output.write("=" * 70 + "\n")
+    def _display_comparison(self, result, parts):
+        """Append comparison section to parts (a deficit goes to errors)."""
+        parts.append("\n\n⚖️  COMPARISON\n" + "=" * 70 + "\n")
         
         if result.has_deficit:
+            # Emit the report so far first, keeping it ahead of the error
+            self.output.write(''.join(parts))
+            parts.clear()
+            deficit = result.deficit
             self.errors.write(
-                f"❌ INSUFFICIENT TIME: {result.deficit:.0f} min "
-                f"({result.deficit/60:.1f} hrs) SHORT\n"
+                f"❌ INSUFFICIENT TIME: {deficit:.0f} min ({deficit/60:.1f} hrs) SHORT\n"
+                f"\nYou need {deficit:.0f} more minutes of venue time.\n"
+                "Options:\n"
+                "  1. Add more venue time slots\n"
+                "  2. Reduce requested rehearsal times\n"
+                "  3. Poll for additional venue availability\n"
             )
-            self.errors.write(
-                f"\nYou need {result.deficit:.0f} more minutes of venue time.\n"
-            )
-            self.errors.write("Options:\n")
-            self.errors.write("  1. Add more venue time slots\n")
-            self.errors.write("  2. Reduce requested rehearsal times\n")
-            self.errors.write("  3. Poll for additional venue availability\n")
             self.errors.flush()
         elif result.has_surplus:
-            self.output.write(
-                f"✓ SURPLUS: {result.surplus:.0f} min "
-                f"({result.surplus/60:.1f} hrs) extra time available\n"
+            surplus = result.surplus
+            parts.append(
+                f"✓ SURPLUS: {surplus:.0f} min ({surplus/60:.1f} hrs) extra time available\n"
+                f"Venue utilization: {result.utilization_pct:.1f}%\n"
             )
-            self.output.write(f"Venue utilization: {result.utilization_pct:.1f}%\n")
         else:
-            self.output.write(
+            parts.append(
                 "✓ PERFECT MATCH: Requested time equals available time\n"
+                "⚠ Warning: No buffer time for adjustments\n"
             )
-            self.output.write("⚠ Warning: No buffer time for adjustments\n")
 
 
 class ConflictReportFormatter:
@@ -140,69 +168,81 @@ class ConflictReportFormatter:
         Args:
             report: ConflictReport object
         """
-        self.output.write("=" * 80 + "\n")
-        self.output.write("REHEARSAL DIRECTOR CONFLICT REPORT\n")
-        self.output.write("=" * 80 + "\n")
+        # Build the report in one buffer and write it with a single call
+        parts = ["=" * 80 + "\n", "REHEARSAL DIRECTOR CONFLICT REPORT\n", "=" * 80 + "\n"]
         
         if not report.has_conflicts:
-            self.output.write("\n✓ NO CONFLICTS FOUND\n")
-            self.output.write("All rehearsal directors are available during all scheduled venue times.\n")
+            parts.append(
+                "\n✓ NO CONFLICTS FOUND\n"
+                "All rehearsal directors are available during all scheduled venue times.\n"
+            )
+            self.output.write(''.join(parts))
             self.output.flush()
             return
         
-        self.output.write(f"\n⚠ Found {report.total_conflicts} potential scheduling conflicts\n")
-        self.output.write(f"Rehearsal Directors with conflicts: {', '.join(report.rds_with_conflicts)}\n")
-        self.output.write("\n" + "=" * 80 + "\n")
+        parts.append(
+            f"\n⚠ Found {report.total_conflicts} potential scheduling conflicts\n"
+            f"Rehearsal Directors with conflicts: {', '.join(report.rds_with_conflicts)}\n"
+            "\n" + "=" * 80 + "\n"
+        )
         
-        # Group by RD
-        conflicts_by_rd = {}
+        # Group by RD (one hash lookup + append per conflict)
+        conflicts_by_rd = defaultdict(list)
         for conflict in report.conflicts:
-            rhd_id = conflict['rhd_id']
-            if rhd_id not in conflicts_by_rd:
-                conflicts_by_rd[rhd_id] = []
-            conflicts_by_rd[rhd_id].append(conflict)
+            conflicts_by_rd[conflict['rhd_id']].append(conflict)
         
         # Display by RD
-        for rhd_id in sorted(conflicts_by_rd.keys()):
-            self.output.write(f"\n{'─' * 80}\n")
-            self.output.write(f"REHEARSAL DIRECTOR: {rhd_id}\n")
+        for rhd_id in sorted(conflicts_by_rd):
+            parts.append("\n" + "─" * 80 + "\n")
+            parts.append(f"REHEARSAL DIRECTOR: {rhd_id}\n")
             
             # Show all dances for this RD
             all_dances = report.rd_dances.get(rhd_id, [])
             if all_dances:
-                self.output.write(f"Responsible for: {', '.join(all_dances)}\n")
+                parts.append(f"Responsible for: {', '.join(all_dances)}\n")
             
-            self.output.write(f"{'─' * 80}\n")
+            parts.append("─" * 80 + "\n")
             
             for conflict in conflicts_by_rd[rhd_id]:
-                self.output.write(f"\n  Venue:      {conflict['venue']}\n")
-                self.output.write(f"  Date/Time:  {conflict['day']}, {conflict['date']} - {conflict['time_slot']}\n")
-                self.output.write(f"  Conflicts:  {', '.join(conflict['conflicting_constraints'])}\n")
+                parts.append(
+                    f"\n  Venue:      {conflict['venue']}\n"
+                    f"  Date/Time:  {conflict['day']}, {conflict['date']} - {conflict['time_slot']}\n"
+                    f"  Conflicts:  {', '.join(conflict['conflicting_constraints'])}\n"
+                )
                 
-                # Show affected dances
-                if conflict['affected_dances']:
-                    self.output.write(f"  Affected:   {', '.join(conflict['affected_dances'])} cannot be scheduled in this slot\n")
+                # Show affected dances; the full join is reused when there
+                # are three or fewer
+                affected = conflict['affected_dances']
+                if affected:
+                    affected_joined = ', '.join(affected)
+                    parts.append(f"  Affected:   {affected_joined} cannot be scheduled in this slot\n")
                 
-                self.output.write(f"\n  ⚠ RD {rhd_id} is unavailable during this time slot\n")
-                self.output.write(f"  Options:\n")
-                self.output.write(f"    • Assign substitute RD for this time slot\n")
-                if conflict['affected_dances']:
-                    affected_display = ', '.join(conflict['affected_dances'][:3])
-                    if len(conflict['affected_dances']) > 3:
-                        affected_display += '...'
-                    self.output.write(f"    • Do not schedule {affected_display} during this slot\n")
+                parts.append(
+                    f"\n  ⚠ RD {rhd_id} is unavailable during this time slot\n"
+                    "  Options:\n"
+                    "    • Assign substitute RD for this time slot\n"
+                )
+                if affected:
+                    if len(affected) > 3:
+                        affected_display = ', '.join(affected[:3]) + '...'
+                    else:
+                        affected_display = affected_joined
+                    parts.append(f"    • Do not schedule {affected_display} during this slot\n")
                 else:
-                    self.output.write(f"    • Do not schedule {rhd_id}'s dances during this slot\n")
-        
-        self.output.write("\n" + "=" * 80 + "\n")
-        self.output.write("\nDIRECTOR ACTIONS:\n")
-        self.output.write("  1. Review each conflict and affected dances above\n")
-        self.output.write("  2. For each conflict, decide:\n")
-        self.output.write("     a) Assign substitute RD and notify them, OR\n")
-        self.output.write("     b) Avoid scheduling those dances in conflicted slots\n")
-        self.output.write("  3. Update constraints if substitutes are assigned\n")
-        self.output.write("  4. Proceed with scheduling\n")
-        self.output.write("=" * 80 + "\n")
+                    parts.append(f"    • Do not schedule {rhd_id}'s dances during this slot\n")
+        
+        parts.append(
+            "\n" + "=" * 80 + "\n"
+            "\nDIRECTOR ACTIONS:\n"
+            "  1. Review each conflict and affected dances above\n"
+            "  2. For each conflict, decide:\n"
+            "     a) Assign substitute RD and notify them, OR\n"
+            "     b) Avoid scheduling those dances in conflicted slots\n"
+            "  3. Update constraints if substitutes are assigned\n"
+            "  4. Proceed with scheduling\n"
+            + "=" * 80 + "\n"
+        )
+        self.output.write(''.join(parts))
         self.output.flush()
     
     def write_csv(self, report, output_path):
@@ -216,23 +256,22 @@ class ConflictReportFormatter:
         import csv
         
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'rhd_id', 'venue', 'day', 'date', 'time_slot', 
-                    'conflicting_constraints', 'affected_dances'
-                ])
-                writer.writeheader()
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                # Positional rows: csv.writer skips DictWriter's per-row
+                # field lookups and extra-key check
+                writer = csv.writer(f)
+                writer.writerow(_CONFLICT_CSV_HEADER)
                 
-                for conflict in report.conflicts:
-                    writer.writerow({
-                        'rhd_id': conflict['rhd_id'],
-                        'venue': conflict['venue'],
-                        'day': conflict['day'],
-                        'date': conflict['date'],
-                        'time_slot': conflict['time_slot'],
-                        'conflicting_constraints': ', '.join(conflict['conflicting_constraints']),
-                        'affected_dances': ', '.join(conflict['affected_dances'])
-                    })
+                # One writerows call over a generator; rows are not materialised
+                writer.writerows((
+                    conflict['rhd_id'],
+                    conflict['venue'],
+                    conflict['day'],
+                    conflict['date'],
+                    conflict['time_slot'],
+                    ', '.join(conflict['conflicting_constraints']),
+                    ', '.join(conflict['affected_dances'])
+                ) for conflict in report.conflicts)
             
             self.output.write(f"\n✓ Conflict report written to: {output_path}\n")
             self.output.flush()
@@ -4,39 +4,55 @@ Conflict Catalog Formatters
 Formats conflict catalog data into human-readable reports (markdown, text, etc.)
 """
 
-from datetime import datetime
-from typing import List
+from typing import List, Optional
 import pandas as pd
 
+from rehearsal_scheduler.reporting.constraint_formatter import DAY_TITLE, DAY_UPPER
+from rehearsal_scheduler.reporting.report_helpers import format_time_range, report_timestamp
 
-def format_catalog_markdown(catalog: List, dances_df: pd.DataFrame = None) -> str:
+
+def _dance_names(dances_df: pd.DataFrame) -> dict:
+    """Build dance_id -> name lookup (empty without dance info)."""
+    if dances_df is None or not len(dances_df.index):
+        return {}
+    return dict(zip(dances_df['dance_id'], dances_df['name']))
+
+
+def format_catalog_markdown(
+    catalog: List,
+    dances_df: pd.DataFrame = None,
+    *,
+    generated_at: Optional[str] = None
+) -> str:
     """
     Format catalog as Markdown report.
     
     Args:
         catalog: List of SlotCatalogEntry objects
         dances_df: Optional DataFrame with dance info (dance_id, dance_name columns)
+        generated_at: Timestamp text for the header (default: now); pass the
+            same value when rendering several formats of one report
         
     Returns:
         Formatted markdown string
     """
-    # Build dance_id -> dance_name lookup
-    dance_names = {}
-    if dances_df is not None and not dances_df.empty:
-        for _, row in dances_df.iterrows():
-            dance_names[row['dance_id']] = row['name']
+    # No lookup to build when the catalog is empty
+    dance_names = _dance_names(dances_df) if catalog else {}
 
     lines = ["# Rehearsal Conflict Catalog\n"]
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+    generated_at = generated_at or report_timestamp()
+    lines.append(f"**Generated:** {generated_at}\n")
     lines.append("---\n")
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         venue = entry.venue_name
+        date_str = slot.rehearsal_date.strftime('%m/%d/%y')
         
         # Slot header
-        lines.append(f"## {slot.day_of_week.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
-        lines.append(f"**Time:** {slot.start_time // 100}:{slot.start_time % 100:02d} - {slot.end_time // 100}:{slot.end_time % 100:02d}")
+        lines.append(f"## {DAY_TITLE.get(day) or day.title()} {date_str}")
+        lines.append(f"**Time:** {format_time_range(slot)}")
         lines.append(f"**Venue:** {venue}\n")
         
         # RD conflicts
@@ -71,34 +87,40 @@ def format_catalog_markdown(catalog: List, dances_df: pd.DataFrame = None) -> st
     return "\n".join(lines)
 
 
-def format_catalog_text(catalog: List, dances_df: pd.DataFrame = None) -> str:
+def format_catalog_text(
+    catalog: List,
+    dances_df: pd.DataFrame = None,
+    *,
+    generated_at: Optional[str] = None
+) -> str:
     """
     Format catalog as plain text report.
     
     Args:
         catalog: List of SlotCatalogEntry objects
         dances_df: Optional DataFrame with dance info
+        generated_at: Timestamp text for the header (default: now)
         
     Returns:
         Formatted text string
     """
-    # Build dance_id -> dance_name lookup
-    dance_names = {}
-    if dances_df is not None and not dances_df.empty:
-        for _, row in dances_df.iterrows():
-            dance_names[row['dance_id']] = row['name']
+    # No lookup to build when the catalog is empty
+    dance_names = _dance_names(dances_df) if catalog else {}
     lines = ["REHEARSAL CONFLICT CATALOG"]
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    generated_at = generated_at or report_timestamp()
+    lines.append(f"Generated: {generated_at}")
     lines.append("=" * 80)
     lines.append("")
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         venue = entry.venue_name
+        date_str = slot.rehearsal_date.strftime('%m/%d/%y')
         
         # Slot header
-        lines.append(f"{slot.day_of_week.upper()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
-        lines.append(f"Time: {slot.start_time // 100}:{slot.start_time % 100:02d} - {slot.end_time // 100}:{slot.end_time % 100:02d}")
+        lines.append(f"{DAY_UPPER.get(day) or day.upper()} {date_str}")
+        lines.append(f"Time: {format_time_range(slot)}")
         lines.append(f"Venue: {venue}")
         lines.append("-" * 80)
         
@@ -148,14 +170,16 @@ def format_catalog_summary(catalog: List) -> str:
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         rd_count = len(entry.rd_conflicts)
-        dancer_count = sum(len(conflicts) for conflicts in entry.dance_conflicts.values())
-        dance_count = len(entry.dance_conflicts)
+        dance_conflicts = entry.dance_conflicts
+        dancer_count = sum(map(len, dance_conflicts.values()))
+        dance_count = len(dance_conflicts)
         
         status = "✓" if (rd_count == 0 and dancer_count == 0) else "✗"
         
         lines.append(
-            f"{status} {slot.day_of_week.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}: "
+            f"{status} {DAY_TITLE.get(day) or day.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}: "
             f"{rd_count} RD conflicts, {dancer_count} dancer conflicts ({dance_count} dances affected)"
         )
     
@@ -2,6 +2,8 @@
 Utility functions for formatting constraints in human-readable form.
 """
 
+import functools
+
 from rehearsal_scheduler.constraints import (
     DayOfWeekConstraint,
     TimeOnDayConstraint,
@@ -10,7 +12,17 @@ from rehearsal_scheduler.constraints import (
     TimeOnDateConstraint
 )
 
+# Display forms of the lowercase day names used by slots and constraints;
+# look up with DAY_TITLE.get(day) or day.title()
+DAY_TITLE = {
+    day: day.title()
+    for day in ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+}
+DAY_UPPER = {day: title.upper() for day, title in DAY_TITLE.items()}
+
 
+# Pure function over a small domain (HHMM ints), called per constraint
+@functools.lru_cache(maxsize=4096)
 def format_time(military_time: int) -> str:
     """
     Format military time as human-readable string.
@@ -35,6 +47,62 @@ def format_time(military_time: int) -> str:
         return f"{hours - 12}:{minutes:02d} pm"
 
 
+def _format_with_times(label: str, start_time: int, end_time: int) -> str:
+    """Append a before/after/range qualifier to a day or date label."""
+    # Handle "all day" case (0 to 2359)
+    if start_time == 0 and end_time >= 2359:
+        return label
+    
+    # Handle "before" case (0 to specific time)
+    if start_time == 0:
+        return f"{label} before {format_time(end_time)}"
+    
+    # Handle "after" case (specific time to end of day)
+    if end_time >= 2359:
+        return f"{label} after {format_time(start_time)}"
+    
+    # Handle time range
+    return f"{label} {format_time(start_time)}-{format_time(end_time)}"
+
+
+def _format_day_of_week(constraint: DayOfWeekConstraint) -> str:
+    day = constraint.day_of_week
+    return DAY_TITLE.get(day) or day.title()
+
+
+def _format_time_on_day(constraint: TimeOnDayConstraint) -> str:
+    day = constraint.day_of_week
+    return _format_with_times(
+        DAY_TITLE.get(day) or day.title(), constraint.start_time, constraint.end_time
+    )
+
+
+def _format_date(constraint: DateConstraint) -> str:
+    return constraint.date.strftime("%b %d, %Y")
+
+
+def _format_date_range(constraint: DateRangeConstraint) -> str:
+    start = constraint.start_date.strftime("%b %d")
+    end = constraint.end_date.strftime("%b %d, %Y")
+    return f"{start} - {end}"
+
+
+def _format_time_on_date(constraint: TimeOnDateConstraint) -> str:
+    return _format_with_times(
+        constraint.date.strftime("%b %d, %Y"), constraint.start_time, constraint.end_time
+    )
+
+
+# Exact-type dispatch for format_constraint
+_CONSTRAINT_FORMATTERS = {
+    DayOfWeekConstraint: _format_day_of_week,
+    TimeOnDayConstraint: _format_time_on_day,
+    DateConstraint: _format_date,
+    DateRangeConstraint: _format_date_range,
+    TimeOnDateConstraint: _format_time_on_date,
+}
+
+
 def format_constraint(constraint) -> str:
     """
     Format a constraint object as human-readable text.
@@ -45,53 +113,14 @@ def format_constraint(constraint) -> str:
     Returns:
         Human-readable description
     """
-    if isinstance(constraint, DayOfWeekConstraint):
-        return constraint.day_of_week.title()
-    
-    elif isinstance(constraint, TimeOnDayConstraint):
-        day = constraint.day_of_week.title()
-        
-        # Handle "all day" case (0 to 2359)
-        if constraint.start_time == 0 and constraint.end_time >= 2359:
-            return day
-        
-        # Handle "before" case (0 to specific time)
-        if constraint.start_time == 0:
-            return f"{day} before {format_time(constraint.end_time)}"
-        
-        # Handle "after" case (specific time to end of day)
-        if constraint.end_time >= 2359:
-            return f"{day} after {format_time(constraint.start_time)}"
-        
-        # Handle time range
-        return f"{day} {format_time(constraint.start_time)}-{format_time(constraint.end_time)}"
+    formatter = _CONSTRAINT_FORMATTERS.get(type(constraint))
+    if formatter is not None:
+        return formatter(constraint)
     
-    elif isinstance(constraint, DateConstraint):
-        return constraint.date.strftime("%b %d, %Y")
+    # Subclasses miss the exact-type lookup
+    for constraint_type, formatter in _CONSTRAINT_FORMATTERS.items():
+        if isinstance(constraint, constraint_type):
+            return formatter(constraint)
     
-    elif isinstance(constraint, DateRangeConstraint):
-        start = constraint.start_date.strftime("%b %d")
-        end = constraint.end_date.strftime("%b %d, %Y")
-        return f"{start} - {end}"
-    
-    elif isinstance(constraint, TimeOnDateConstraint):
-        date_str = constraint.date.strftime("%b %d, %Y")
-        
-        # Handle "all day"
-        if constraint.start_time == 0 and constraint.end_time >= 2359:
-            return date_str
-        
-        # Handle "before"
-        if constraint.start_time == 0:
-            return f"{date_str} before {format_time(constraint.end_time)}"
-        
-        # Handle "after"
-        if constraint.end_time >= 2359:
-            return f"{date_str} after {format_time(constraint.start_time)}"
-        
-        # Handle time range
-        return f"{date_str} {format_time(constraint.start_time)}-{format_time(constraint.end_time)}"
-    
-    else:
-        # Fallback to string representation
-        return str(constraint)
\ No newline at end of file
+    # Fallback to string representation
+    return str(constraint)
@@ -0,0 +1,18 @@
+"""
+Report Helpers
+
+Small formatting helpers shared by the catalog report formatters.
+"""
+
+from datetime import datetime
+
+
+def report_timestamp() -> str:
+    """Current time as shown in report headers."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M')
+
+
+def format_time_range(slot) -> str:
+    """Slot start/end as H:MM - H:MM, from military time ints."""
+    start, end = slot.start_time, slot.end_time
+    return f"{start // 100}:{start % 100:02d} - {end // 100}:{end % 100:02d}"
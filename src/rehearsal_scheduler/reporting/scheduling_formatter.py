@@ -5,15 +5,26 @@ Formats scheduling catalog data into human-readable reports.
 Shows RD conflicts, ineligible dance groups, and dancer conflicts by group.
 """
 
-from datetime import datetime
-from typing import List
+from typing import List, Optional
 import pandas as pd
 
+from rehearsal_scheduler.reporting.constraint_formatter import DAY_TITLE, DAY_UPPER
+from rehearsal_scheduler.reporting.report_helpers import format_time_range, report_timestamp
+
+
+def _group_names(dance_groups_df: pd.DataFrame) -> dict:
+    """Build dg_id -> dg_name lookup (empty without group info)."""
+    if dance_groups_df is None or not len(dance_groups_df.index):
+        return {}
+    return dict(zip(dance_groups_df['dg_id'], dance_groups_df['dg_name']))
+
 
 def format_scheduling_catalog_markdown(
     catalog: List, 
     dance_groups_df: pd.DataFrame = None,
-    show_availability: bool = False
+    show_availability: bool = False,
+    *,
+    generated_at: Optional[str] = None
 ) -> str:
     """
     Format scheduling catalog as Markdown report.
@@ -22,29 +33,29 @@ def format_scheduling_catalog_markdown(
         catalog: List of SchedulingSlotEntry objects
         dance_groups_df: Optional DataFrame with dance group info
         show_availability: If True, show availability windows instead of conflicts
+        generated_at: Timestamp text for the header (default: now)
         
     Returns:
         Formatted markdown string
     """
     # Build dg_id -> dg_name lookup
-    group_names = {}
-    if dance_groups_df is not None and not dance_groups_df.empty:
-        for _, row in dance_groups_df.iterrows():
-            group_names[row['dg_id']] = row['dg_name']
+    group_names = _group_names(dance_groups_df)
     
     lines = ["# Rehearsal Scheduling Catalog\n"]
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
+    generated_at = generated_at or report_timestamp()
+    lines.append(f"**Generated:** {generated_at}\n")
     if show_availability:
         lines.append("**Mode:** Showing dancer availability windows\n")
     lines.append("---\n")
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         venue = entry.venue_name
         
         # Slot header
-        lines.append(f"## {slot.day_of_week.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
-        lines.append(f"**Time:** {slot.start_time // 100}:{slot.start_time % 100:02d} - {slot.end_time // 100}:{slot.end_time % 100:02d}")
+        lines.append(f"## {DAY_TITLE.get(day) or day.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
+        lines.append(f"**Time:** {format_time_range(slot)}")
         lines.append(f"**Venue:** {venue}\n")
         
         # RD conflicts or availability
@@ -56,8 +67,7 @@ def format_scheduling_catalog_markdown(
             else:
                 lines.append("### ❌ RD Conflicts\n")
             
-            for conflict in rd_conflicts:
-                lines.append(f"- **{conflict.full_name}** ({conflict.entity_id}): {conflict.reason}")
+            lines.extend(f"- **{c.full_name}** ({c.entity_id}): {c.reason}" for c in rd_conflicts)
         else:
             if show_availability:
                 lines.append("### ✅ All RDs Fully Available\n")
@@ -68,9 +78,10 @@ def format_scheduling_catalog_markdown(
         ineligible_groups = entry.ineligible_groups
         if ineligible_groups:
             lines.append("\n### 🚫 Dance Groups Unavailable (RD conflicts)\n")
-            for group in ineligible_groups:
-                group_display = group_names.get(group.dg_id, group.dg_name)
-                lines.append(f"- **{group_display}** ({group.dg_id}) - directed by {group.rd_name}")
+            lines.extend(
+                f"- **{group_names.get(g.dg_id, g.dg_name)}** ({g.dg_id}) - directed by {g.rd_name}"
+                for g in ineligible_groups
+            )
         
         # Dancer conflicts or availability by group (only eligible groups shown)
         group_conflicts = entry.group_conflicts
@@ -104,8 +115,7 @@ def format_scheduling_catalog_markdown(
                         lines.append(f"\n**{dg_id}**")
                 
                 # Show individual dancer availability/conflicts
-                for conflict in conflicts:
-                    lines.append(f"  - {conflict.full_name} ({conflict.entity_id}): {conflict.reason}")
+                lines.extend(f"  - {c.full_name} ({c.entity_id}): {c.reason}" for c in conflicts)
         else:
             # Only show if there are eligible groups (some might be ineligible)
             if not ineligible_groups:
@@ -122,7 +132,9 @@ def format_scheduling_catalog_markdown(
 def format_scheduling_catalog_text(
     catalog: List, 
     dance_groups_df: pd.DataFrame = None,
-    show_availability: bool = False
+    show_availability: bool = False,
+    *,
+    generated_at: Optional[str] = None
 ) -> str:
     """
     Format scheduling catalog as plain text report.
@@ -131,18 +143,17 @@ def format_scheduling_catalog_text(
         catalog: List of SchedulingSlotEntry objects
         dance_groups_df: Optional DataFrame with dance group info
         show_availability: If True, show availability windows instead of conflicts
+        generated_at: Timestamp text for the header (default: now)
         
     Returns:
         Formatted text string
     """
     # Build dg_id -> dg_name lookup
-    group_names = {}
-    if dance_groups_df is not None and not dance_groups_df.empty:
-        for _, row in dance_groups_df.iterrows():
-            group_names[row['dg_id']] = row['dg_name']
+    group_names = _group_names(dance_groups_df)
     
     lines = ["REHEARSAL SCHEDULING CATALOG"]
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    generated_at = generated_at or report_timestamp()
+    lines.append(f"Generated: {generated_at}")
     if show_availability:
         lines.append("Mode: Showing dancer availability windows")
     lines.append("=" * 80)
@@ -150,11 +161,12 @@ def format_scheduling_catalog_text(
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         venue = entry.venue_name
         
         # Slot header
-        lines.append(f"{slot.day_of_week.upper()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
-        lines.append(f"Time: {slot.start_time // 100}:{slot.start_time % 100:02d} - {slot.end_time // 100}:{slot.end_time % 100:02d}")
+        lines.append(f"{DAY_UPPER.get(day) or day.upper()} {slot.rehearsal_date.strftime('%m/%d/%y')}")
+        lines.append(f"Time: {format_time_range(slot)}")
         lines.append(f"Venue: {venue}")
         lines.append("-" * 80)
         
@@ -167,8 +179,7 @@ def format_scheduling_catalog_text(
             lines.append("\nRD CONFLICTS:")
         
         if rd_conflicts:
-            for conflict in rd_conflicts:
-                lines.append(f"  - {conflict.full_name} ({conflict.entity_id}): {conflict.reason}")
+            lines.extend(f"  - {c.full_name} ({c.entity_id}): {c.reason}" for c in rd_conflicts)
         else:
             if show_availability:
                 lines.append("  (All RDs fully available)")
@@ -179,9 +190,10 @@ def format_scheduling_catalog_text(
         ineligible_groups = entry.ineligible_groups
         if ineligible_groups:
             lines.append("\nDANCE GROUPS UNAVAILABLE (RD conflicts):")
-            for group in ineligible_groups:
-                group_display = group_names.get(group.dg_id, group.dg_name)
-                lines.append(f"  - {group_display} ({group.dg_id}) - directed by {group.rd_name}")
+            lines.extend(
+                f"  - {group_names.get(g.dg_id, g.dg_name)} ({g.dg_id}) - directed by {g.rd_name}"
+                for g in ineligible_groups
+            )
         
         # Dancer conflicts or availability by group
         group_conflicts = entry.group_conflicts
@@ -214,8 +226,7 @@ def format_scheduling_catalog_text(
                     else:
                         lines.append(f"\n  {dg_id}:")
                 
-                for conflict in conflicts:
-                    lines.append(f"    - {conflict.full_name} ({conflict.entity_id}): {conflict.reason}")
+                lines.extend(f"    - {c.full_name} ({c.entity_id}): {c.reason}" for c in conflicts)
         else:
             if not ineligible_groups:
                 if show_availability:
@@ -244,15 +255,17 @@ def format_scheduling_catalog_summary(catalog: List) -> str:
     
     for entry in catalog:
         slot = entry.slot
+        day = slot.day_of_week
         rd_count = len(entry.rd_conflicts)
         ineligible_count = len(entry.ineligible_groups)
-        dancer_count = sum(len(conflicts) for conflicts in entry.group_conflicts.values())
-        group_count = len(entry.group_conflicts)
+        group_conflicts = entry.group_conflicts
+        dancer_count = sum(map(len, group_conflicts.values()))
+        group_count = len(group_conflicts)
         
         status = "✓" if (rd_count == 0 and dancer_count == 0) else "✗"
         
         lines.append(
-            f"{status} {slot.day_of_week.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}: "
+            f"{status} {DAY_TITLE.get(day) or day.title()} {slot.rehearsal_date.strftime('%m/%d/%y')}: "
             f"{rd_count} RD conflicts, {ineligible_count} groups unavailable, "
             f"{dancer_count} dancer conflicts ({group_count} groups affected)"
         )
@@ -10,6 +10,9 @@ from pathlib import Path
 from typing import List, Optional, TextIO
 import sys
 
+# Column order of ValidationReportFormatter.write_error_csv rows
+_ERROR_CSV_HEADER = ('entity_id', 'row', 'token_num', 'token', 'error')
+
 
 class ValidationReportFormatter:
     """Formats validation results for display and file output."""
@@ -102,21 +105,14 @@ class ValidationReportFormatter:
         stream = message_stream or self.output
         
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(
-                    f, 
-                    fieldnames=['entity_id', 'row', 'token_num', 'token', 'error']
-                )
-                writer.writeheader()
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(_ERROR_CSV_HEADER)
                 
-                for error in errors:
-                    writer.writerow({
-                        'entity_id': error.entity_id,
-                        'row': error.row,
-                        'token_num': error.token_num,
-                        'token': error.token,
-                        'error': error.error
-                    })
+                writer.writerows(
+                    (error.entity_id, error.row, error.token_num, error.token, error.error)
+                    for error in errors
+                )
             
             stream.write(f"\nError report written to: {output_path}\n")
             stream.flush()
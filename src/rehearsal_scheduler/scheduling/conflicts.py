@@ -6,7 +6,7 @@ from rehearsal_scheduler.constraints import (
     DayOfWeekConstraint, TimeOnDayConstraint,
     DateConstraint, DateRangeConstraint
 )
-from rehearsal_scheduler.models.intervals import TimeInterval, parse_date_string
+from rehearsal_scheduler.models.intervals import parse_date_string
 
 
 def check_slot_conflicts(
@@ -35,6 +35,13 @@ def check_slot_conflicts(
     conflicting = []
     slot_day = slot_day.lower()
     
+    # Constraints store military-time ints, so convert the slot once and
+    # compare integers directly.
+    slot_times = None
+    if slot_start and slot_end:
+        slot_times = (slot_start.hour * 100 + slot_start.minute,
+                      slot_end.hour * 100 + slot_end.minute)
+    
     for token_text, parsed_result in parsed_constraints:
         # Handle tuple of constraints
         if isinstance(parsed_result, tuple):
@@ -52,16 +59,11 @@ def check_slot_conflicts(
             
             elif isinstance(constraint, TimeOnDayConstraint):
                 # Unavailable during specific time on this day
-                if constraint.day_of_week == slot_day and slot_start and slot_end:
-                    constraint_start = time(constraint.start_time // 100, 
-                                          constraint.start_time % 100)
-                    constraint_end = time(constraint.end_time // 100, 
-                                        constraint.end_time % 100)
-                    
-                    # Use TimeInterval.overlaps()
-                    slot_interval = TimeInterval(slot_start, slot_end)
-                    constraint_interval = TimeInterval(constraint_start, constraint_end)
-                    if slot_interval.overlaps(constraint_interval):
+                if constraint.day_of_week == slot_day and slot_times:
+                    slot_start_mil, slot_end_mil = slot_times
+                    # Same test as TimeInterval.overlaps()
+                    if (constraint.start_time < slot_end_mil
+                            and slot_start_mil < constraint.end_time):
                         conflict = True
             
             elif isinstance(constraint, DateConstraint):
@@ -30,6 +30,7 @@ from rehearsal_scheduler.reporting.catalog_formatter import (
     format_catalog_text,
     format_catalog_summary
 )
+from rehearsal_scheduler.reporting.report_helpers import report_timestamp
 
 
 @click.command()
@@ -63,6 +64,9 @@ def cli(config, csv_dir, output, output_format, verbose):
         click.echo(click.style("Error: Must provide --config or --csv-dir", fg='red'))
         sys.exit(1)
     
+    # One timestamp for the report header: when its data was read
+    generated_at = report_timestamp()
+    
     # Load data into DataFrames
     click.echo("📊 Loading data...")
     
@@ -108,8 +112,7 @@ def cli(config, csv_dir, output, output_format, verbose):
     # Count conflicts
     total_rd_conflicts = sum(len(entry.rd_conflicts) for entry in catalog)
     total_dancer_conflicts = sum(
-        sum(len(conflicts) for conflicts in entry.dance_conflicts.values())
-        for entry in catalog
+        sum(map(len, entry.dance_conflicts.values())) for entry in catalog
     )
     
     click.echo(f"  Analyzed {len(catalog)} rehearsal slots")
@@ -121,9 +124,13 @@ def cli(config, csv_dir, output, output_format, verbose):
     
     try:
         if output_format == 'markdown':
-            report = format_catalog_markdown(catalog, data.get('dances'))
+            report = format_catalog_markdown(
+                catalog, data.get('dances'), generated_at=generated_at
+            )
         elif output_format == 'text':
-            report = format_catalog_text(catalog, data.get('dances'))
+            report = format_catalog_text(
+                catalog, data.get('dances'), generated_at=generated_at
+            )
         else:  # summary
             report = format_catalog_summary(catalog)
     except Exception as e:
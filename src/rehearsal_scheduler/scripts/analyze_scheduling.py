@@ -32,6 +32,7 @@ from rehearsal_scheduler.reporting.scheduling_formatter import (
     format_scheduling_catalog_text,
     format_scheduling_catalog_summary
 )
+from rehearsal_scheduler.reporting.report_helpers import report_timestamp
 
 DEFAULT_CONFIG_PATH = 'config/workbook_config.yaml'
 
@@ -68,6 +69,9 @@ def cli(config, csv_dir, output, output_format, show_availability, verbose):
         click.echo(click.style("Error: Must provide --config or --csv-dir", fg='red'))
         sys.exit(1)
     
+    # One timestamp for the report header: when its data was read
+    generated_at = report_timestamp()
+    
     # Load data into DataFrames
     click.echo("📊 Loading scheduling data...")
     
@@ -129,8 +133,7 @@ def cli(config, csv_dir, output, output_format, show_availability, verbose):
     total_rd_conflicts = sum(len(entry.rd_conflicts) for entry in catalog)
     total_ineligible = sum(len(entry.ineligible_groups) for entry in catalog)
     total_dancer_conflicts = sum(
-        sum(len(conflicts) for conflicts in entry.group_conflicts.values())
-        for entry in catalog
+        sum(map(len, entry.group_conflicts.values())) for entry in catalog
     )
     
     click.echo(f"  Analyzed {len(catalog)} rehearsal slots")
@@ -146,13 +149,15 @@ def cli(config, csv_dir, output, output_format, show_availability, verbose):
             report = format_scheduling_catalog_markdown(
                 catalog, 
                 data.get('dance_groups'),
-                show_availability=show_availability
+                show_availability=show_availability,
+                generated_at=generated_at
             )
         elif output_format == 'text':
             report = format_scheduling_catalog_text(
                 catalog, 
                 data.get('dance_groups'),
-                show_availability=show_availability
+                show_availability=show_availability,
+                generated_at=generated_at
             )
         else:  # summary
             report = format_scheduling_catalog_summary(catalog)
@@ -25,7 +25,6 @@ Usage:
 import sys
 import click
 import pandas as pd
-from datetime import time
 from typing import Dict
 
 from rehearsal_scheduler.persistence.data_loader import SchedulingDataLoader
@@ -100,7 +99,7 @@ def calculate_participation_score(
     parser = constraint_parser()
     
     # Get dancers in this group
-    dancers_in_group = group_cast_df[group_cast_df[dg_id] == '1'].index.tolist()
+    dancers_in_group = group_cast_df[group_cast_df[dg_id] == 1].index.tolist()
     
     if not dancers_in_group or total_slot_minutes == 0:
         return 0.0
@@ -125,10 +124,7 @@ def calculate_participation_score(
         
         # Calculate availability for this dancer across all slots
         for slot in rehearsal_slots:
-            slot_interval = TimeInterval(
-                time(slot.start_time // 100, slot.start_time % 100),
-                time(slot.end_time // 100, slot.end_time % 100)
-            )
+            slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
             
             try:
                 parsed_constraints = parser.parse(constraint_text)
@@ -200,7 +196,7 @@ def get_full_availability_intervals(
     
     parser = constraint_parser()
     
-    dancers_in_group = group_cast_df[group_cast_df[dg_id] == '1'].index.tolist()
+    dancers_in_group = group_cast_df[group_cast_df[dg_id] == 1].index.tolist()
     
     if not dancers_in_group:
         return []
@@ -302,10 +298,7 @@ def generate_availability_matrix(data: Dict[str, pd.DataFrame], verbose: bool =
     #     ineligible_by_slot.append({g.dg_id for g in ineligible_groups})
 
     for i, slot in enumerate(rehearsal_slots):
-        slot_interval = TimeInterval(
-            time(slot.start_time // 100, slot.start_time % 100),
-            time(slot.end_time // 100, slot.end_time % 100)
-        )
+        slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
     
         rd_conflicts = find_conflicted_rds(slot, data['rd_constraints'])
         ineligible_groups = find_ineligible_groups(
@@ -330,10 +323,7 @@ def generate_availability_matrix(data: Dict[str, pd.DataFrame], verbose: bool =
         full_availability_intervals = {}  # Store actual intervals for priority calc
         
         for i, slot in enumerate(rehearsal_slots):
-            slot_interval = TimeInterval(
-                time(slot.start_time // 100, slot.start_time % 100),
-                time(slot.end_time // 100, slot.end_time % 100)
-            )
+            slot_interval = TimeInterval.from_military(slot.start_time, slot.end_time)
             
             # Skip if RD unavailable
             if dg_id in ineligible_by_slot[i]:
@@ -160,6 +160,7 @@ def greedy_schedule_slot(
     """
     from rehearsal_scheduler.models.interval_parsing import (
         parse_availability_string,
+        parse_availability_column,
         does_duration_fit_in_intervals
     )
     from rehearsal_scheduler.models.interval_operations import subtract_intervals
@@ -203,7 +204,12 @@ def greedy_schedule_slot(
             # Parsing failed - treat as no availability
             return []
     
-    candidates['parsed_intervals'] = candidates[slot_name].apply(safe_parse_availability)
+    # Whole column at once; special cases like 'none' don't parse and give []
+    candidates['parsed_intervals'] = pd.Series(
+        parse_availability_column(candidates[slot_name], errors='empty'),
+        index=candidates.index,
+        dtype=object
+    )
     
     # Sort candidates based on strategy
     if sort_by == 'priority':
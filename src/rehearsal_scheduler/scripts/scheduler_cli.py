@@ -16,10 +16,9 @@ import click
 from rehearsal_scheduler.grammar import validate_token
 from rehearsal_scheduler.scheduling.conflicts import check_slot_conflicts_from_dict
 from rehearsal_scheduler.models.intervals import (
+    TIME_FORMATS,
     TimeInterval, 
-    parse_time_string, 
-    parse_date_string, 
-    time_to_minutes
+    parse_date_string
 )
 
 try:
@@ -94,11 +93,10 @@ def schedule(time_requests, venue_schedule, dance_matrix, dancer_conflicts,
         
         # Load dance matrix (cast)
         source = DataSourceFactory.create_csv(dance_matrix)
-        records = source.read_records()
-        dance_matrix_data = {}
-        for row in records:
-            dance_id = row['dance']
-            dance_matrix_data[dance_id] = row
+        df = source.read_dataframe()
+        dance_matrix_data = (
+            dict(zip(df['dance'], df.to_dict('records'))) if len(df.index) else {}
+        )
         
         # Load dancer conflicts
         source = DataSourceFactory.create_csv(dancer_conflicts)
@@ -110,8 +108,8 @@ def schedule(time_requests, venue_schedule, dance_matrix, dancer_conflicts,
         
         # Load dance-to-RD mapping
         source = DataSourceFactory.create_csv(dance_map)
-        records = source.read_records()
-        dance_map_data = {row['dance_id']: row['rhd_id'] for row in records}
+        df = source.read_dataframe()
+        dance_map_data = dict(zip(df['dance_id'], df['rhd_id'])) if len(df.index) else {}
         
         click.echo("✓ All data loaded successfully")
         
@@ -212,38 +210,48 @@ def parse_all_constraints(conflicts_data, id_column):
     return constraint_map
 
 
+def _time_column_minutes(values):
+    """
+    Parse a column of time strings to minutes since midnight.
+    
+    Tries the same formats as parse_time_string, one whole column per
+    format; cells no format accepts come back as NaN.
+    """
+    import pandas as pd
+    
+    column = pd.Series(values, dtype=object).str.strip()
+    parsed = None
+    for fmt in TIME_FORMATS:
+        attempt = pd.to_datetime(column, format=fmt, errors='coerce')
+        parsed = attempt if parsed is None else parsed.fillna(attempt)
+    return (parsed.dt.hour * 60 + parsed.dt.minute).to_numpy()
+
+
 def build_venue_slots(venue_schedule):
     """Convert venue schedule into time slots."""
-    slots = []
+    rows = list(venue_schedule)
+    start_strs = [row.get('start', '') for row in rows]
+    end_strs = [row.get('end', '') for row in rows]
     
-    for row in venue_schedule:
-        venue = row.get('venue', '')
-        day = row.get('day', '')
-        date_str = row.get('date', '')
-        start_str = row.get('start', '')
-        end_str = row.get('end', '')
-        
-        # Parse times
-        try:
-            start_time = parse_time_string(start_str)
-            end_time = parse_time_string(end_str)
-        except Exception:
+    # Parse times a column at a time; rows with an unparseable time are skipped
+    start_mins = _time_column_minutes(start_strs)
+    end_mins = _time_column_minutes(end_strs)
+    available = end_mins - start_mins
+    
+    slots = []
+    for row, start_str, end_str, available_mins in zip(rows, start_strs, end_strs, available):
+        if available_mins != available_mins:  # NaN
             continue
-        
-        if start_time and end_time:
-            start_mins = time_to_minutes(start_time)
-            end_mins = time_to_minutes(end_time)
-            available_mins = end_mins - start_mins
-            
-            slots.append({
-                'venue': venue,
-                'day': day,
-                'date': date_str,
-                'start': start_str,
-                'end': end_str,
-                'available_minutes': available_mins,
-                'remaining_minutes': available_mins
-            })
+        available_mins = int(available_mins)
+        slots.append({
+            'venue': row.get('venue', ''),
+            'day': row.get('day', ''),
+            'date': row.get('date', ''),
+            'start': start_str,
+            'end': end_str,
+            'available_minutes': available_mins,
+            'remaining_minutes': available_mins
+        })
     
     return slots
 
@@ -359,18 +367,18 @@ def catalog_by_venue(dance_matrix, dancer_conflicts, rhd_conflicts,
         
         # Load dancer conflicts
         source = DataSourceFactory.create_csv(dancer_conflicts)
-        records = source.read_records()
-        dancer_constraints = {row['dancer_id']: row['conflicts'] for row in records}
+        df = source.read_dataframe()
+        dancer_constraints = dict(zip(df['dancer_id'], df['conflicts'])) if len(df.index) else {}
         
         # Load RD conflicts
         source = DataSourceFactory.create_csv(rhd_conflicts)
-        records = source.read_records()
-        rhd_constraints = {row['rhd_id']: row['conflicts'] for row in records}
+        df = source.read_dataframe()
+        rhd_constraints = dict(zip(df['rhd_id'], df['conflicts'])) if len(df.index) else {}
         
         # Load dance to RD mapping
         source = DataSourceFactory.create_csv(dance_map)
-        records = source.read_records()
-        dance_to_rd = {row['dance_id']: row['rhd_id'] for row in records}
+        df = source.read_dataframe()
+        dance_to_rd = dict(zip(df['dance_id'], df['rhd_id'])) if len(df.index) else {}
         
         # Load venue schedule
         source = DataSourceFactory.create_csv(venue_schedule)
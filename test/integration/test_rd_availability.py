@@ -150,7 +150,7 @@ def test_calculate_full_availability_for_group_all_available():
     slot_interval = TimeInterval(time(18, 0), time(21, 0))
     
     group_cast = pd.DataFrame({
-        'dg_01': ['1', '1'],
+        'dg_01': [1, 1],
     }, index=['dancer_01', 'dancer_02'])
     
     dancer_constraints = pd.DataFrame({
@@ -187,7 +187,7 @@ def test_calculate_full_availability_for_group_no_overlap():
     slot_interval = TimeInterval(time(18, 0), time(21, 0))
     
     group_cast = pd.DataFrame({
-        'dg_01': ['1', '1'],
+        'dg_01': [1, 1],
     }, index=['dancer_01', 'dancer_02'])
     
     dancer_constraints = pd.DataFrame({
@@ -268,7 +268,7 @@ def test_find_availability_by_group_partial_availability():
     })
     
     group_cast = pd.DataFrame({
-        'd_01': ['1', '1'],
+        'd_01': [1, 1],
     }, index=['dancer_01', 'dancer_02'])
     
     dancer_constraints = pd.DataFrame({
@@ -313,7 +313,7 @@ def test_find_availability_by_group_zero_availability():
     })
     
     group_cast = pd.DataFrame({
-        'd_01': ['1'],
+        'd_01': [1],
     }, index=['dancer_01'])
     
     dancer_constraints = pd.DataFrame({
@@ -354,7 +354,7 @@ def test_find_availability_by_group_with_full_calculation():
     })
     
     group_cast = pd.DataFrame({
-        'd_01': ['1', '1'],
+        'd_01': [1, 1],
     }, index=['dancer_01', 'dancer_02'])
     
     dancer_constraints = pd.DataFrame({
@@ -400,8 +400,8 @@ def test_find_availability_by_group_skip_ineligible():
     })
     
     group_cast = pd.DataFrame({
-        'd_01': ['1'],
-        'd_02': ['1']
+        'd_01': [1],
+        'd_02': [1]
     }, index=['dancer_01'])
     
     dancer_constraints = pd.DataFrame({
@@ -439,7 +439,7 @@ def test_calculate_separate_rd_dancer_availability():
     slot_interval = TimeInterval(time(18, 0), time(21, 0))
     
     group_cast = pd.DataFrame({
-        'd_01': ['1', '1'],
+        'd_01': [1, 1],
     }, index=['dancer_01', 'dancer_02'])
     
     dancer_constraints = pd.DataFrame({
@@ -236,7 +236,7 @@ class TestFindConflictsByGroup:
         
         # Group cast matrix: dancers in columns
         group_cast_df = pd.DataFrame(
-            {'d_01': ['1', '1', '']},
+            {'d_01': [1, 1, 0]},
             index=['dancer_01', 'dancer_02', 'dancer_03']
         )
         group_cast_df.index.name = 'dancer_id'
@@ -276,7 +276,7 @@ class TestFindConflictsByGroup:
         ])
         
         group_cast_df = pd.DataFrame(
-            {'d_01': ['1']},
+            {'d_01': [1]},
             index=['dancer_01']
         )
         group_cast_df.index.name = 'dancer_id'
@@ -324,8 +324,8 @@ class TestGenerateSchedulingCatalog:
             ]),
             'group_cast': pd.DataFrame(
                 {
-                    'd_01': ['1', '1'],
-                    'd_02': ['', '1']
+                    'd_01': [1, 1],
+                    'd_02': [0, 1]
                 },
                 index=['dancer_01', 'dancer_02']
             ),
@@ -383,6 +383,25 @@ def test_subtract_early_exit_on_second_interval():
     
     assert len(result) == 0
 
+
+def test_subtract_ignores_intervals_outside_base():
+    """Test subtracts before and after the base are skipped."""
+    base = TimeInterval(time(12, 0), time(16, 0))
+    subtracts = [
+        TimeInterval(time(8, 0), time(9, 0)),
+        TimeInterval(time(10, 0), time(12, 0)),  # Adjacent, no overlap
+        TimeInterval(time(13, 0), time(14, 0)),
+        TimeInterval(time(16, 0), time(17, 0)),  # Adjacent, no overlap
+        TimeInterval(time(18, 0), time(20, 0))
+    ]
+    
+    result = subtract_intervals(base, subtracts)
+    
+    assert result == [
+        TimeInterval(time(12, 0), time(13, 0)),
+        TimeInterval(time(14, 0), time(16, 0))
+    ]
+
 # ============================================================================
 # Test merge_adjacent_intervals
 # ============================================================================
@@ -418,4 +437,16 @@ def test_merge_empty():
     
     result = merge_adjacent_intervals(intervals)
     
-    assert len(result) == 0
\ No newline at end of file
+    assert len(result) == 0
+
+def test_merge_contained_interval():
+    """Test an interval inside the previous run does not shrink it."""
+    intervals = [
+        TimeInterval(time(9, 0), time(15, 0)),
+        TimeInterval(time(10, 0), time(11, 0)),
+        TimeInterval(time(15, 0), time(16, 0))
+    ]
+    
+    result = merge_adjacent_intervals(intervals)
+    
+    assert result == [TimeInterval(time(9, 0), time(16, 0))]
@@ -3,6 +3,7 @@ Tests for interval parsing utilities.
 """
 
 import pytest
+import pandas as pd
 from datetime import time
 
 from rehearsal_scheduler.models.intervals import TimeInterval
@@ -10,8 +11,10 @@ from rehearsal_scheduler.models.interval_parsing import (
     parse_time_string,
     parse_interval_string,
     parse_availability_string,
+    parse_availability_column,
     does_duration_fit_in_intervals,
-    find_best_fit_interval
+    find_best_fit_interval,
+    AvailabilityIndex
 )
 
 # ============================================================================
@@ -157,6 +160,79 @@ def test_parse_availability_three_intervals():
     assert intervals[2].start == time(14, 0)
 
 
+def test_parse_availability_returns_fresh_list():
+    """Test cached results are not shared between callers."""
+    first = parse_availability_string("7:00 pm - 8:00 pm")
+    first.append(None)
+    
+    assert parse_availability_string("7:00 pm - 8:00 pm") == [
+        TimeInterval(time(19, 0), time(20, 0))
+    ]
+
+
+# ============================================================================
+# Test parse_availability_column
+# ============================================================================
+
+def test_parse_availability_column_matches_string_parser():
+    """Test column parsing agrees with per-string parsing."""
+    values = [
+        "7:00 pm - 8:30 pm",
+        "",
+        "7:00 pm - 8:00 pm, 9:00 pm - 9:30 PM",
+        "12:00 am - 12:30 am",
+        "11:00 am - 12:00 pm"
+    ]
+    series = pd.Series(values, index=[4, 4, 2, 0, 7])
+    
+    result = parse_availability_column(series)
+    
+    assert result == [parse_availability_string(v) for v in values]
+
+
+def test_parse_availability_column_matches_string_parser_edge_cases():
+    """Test column and string parsers agree where the regex doesn't fit."""
+    values = [
+        "7:00pm-8:30pm",               # No ' - ': string parser rejects
+        "7:00 pm - 8:30 pm (maybe)",   # Trailing text after meridiem
+        "7:00pm - 8:30pm",
+        "7:00 pm  -  8:30 pm",
+        "7:00 pm - 8:00 pm, 9:00 pm-9:30 pm",
+    ]
+    
+    result = parse_availability_column(pd.Series(values), errors='empty')
+    
+    expected = []
+    for v in values:
+        try:
+            expected.append(parse_availability_string(v))
+        except ValueError:
+            expected.append([])
+    assert result == expected
+    assert result[0] == []
+    assert result[1] == [TimeInterval(time(19, 0), time(20, 30))]
+
+
+def test_parse_availability_column_invalid_raises():
+    """Test unparseable entry raises by default."""
+    with pytest.raises(ValueError, match="Invalid interval format"):
+        parse_availability_column(pd.Series(["7:00 pm - 8:00 pm", "none"]))
+
+
+def test_parse_availability_column_invalid_empty():
+    """Test errors='empty' gives bad rows no availability."""
+    series = pd.Series([
+        "7:00 pm - 8:00 pm",
+        "none",
+        "7:00 pm - 8:00 pm, 9:00 pm - 8:00 pm",  # Second interval backwards
+        None
+    ])
+    
+    result = parse_availability_column(series, errors='empty')
+    
+    assert result == [[TimeInterval(time(19, 0), time(20, 0))], [], [], []]
+
+
 # ============================================================================
 # Test does_duration_fit_in_intervals
 # ============================================================================
@@ -251,4 +327,35 @@ def test_find_best_fit_no_fit():
 def test_find_best_fit_empty_list():
     """Test error with empty intervals list."""
     with pytest.raises(ValueError):
-        find_best_fit_interval(60, [])
\ No newline at end of file
+        find_best_fit_interval(60, [])
+
+
+# ============================================================================
+# Test AvailabilityIndex
+# ============================================================================
+
+def test_availability_index_matches_functions():
+    """Test index answers agree with the one-shot functions."""
+    intervals = [
+        TimeInterval(time(19, 0), time(21, 0)),  # 120 minutes
+        TimeInterval(time(14, 0), time(15, 30)),  # 90 minutes
+        TimeInterval(time(10, 0), time(11, 30))  # 90 minutes
+    ]
+    index = AvailabilityIndex(intervals)
+    
+    for minutes in (30, 90, 91, 120):
+        assert index.fits(minutes) == does_duration_fit_in_intervals(minutes, intervals)
+        assert index.best_fit(minutes) == find_best_fit_interval(minutes, intervals)
+    
+    assert not index.fits(121)
+    with pytest.raises(ValueError, match="No interval large enough"):
+        index.best_fit(121)
+
+
+def test_availability_index_empty():
+    """Test empty index fits nothing."""
+    index = AvailabilityIndex([])
+    
+    assert not index.fits(0)
+    with pytest.raises(ValueError):
+        index.best_fit(30)
@@ -77,6 +77,28 @@ def test_time_interval_from_strings_junk():
         interval = TimeInterval.from_strings("x9:00", "17:00")
     assert "Cannot parse time: x9:00" in str(e)
 
+def test_time_interval_from_military():
+    """Test building from military time integers."""
+    interval = TimeInterval.from_military(905, 1730)
+    assert interval.start == time(9, 5)
+    assert interval.end == time(17, 30)
+
+
+def test_time_interval_minutes_since_midnight():
+    """Test cached minute values."""
+    interval = TimeInterval(time(9, 5), time(17, 30))
+    assert interval.start_min == 545
+    assert interval.end_min == 1050
+    assert interval == TimeInterval(time(9, 5), time(17, 30))
+
+
+def test_time_interval_uses_slots():
+    """Test TimeInterval has no per-instance __dict__ and stays hashable."""
+    interval = TimeInterval(time(9, 0), time(10, 0))
+    assert not hasattr(interval, '__dict__')
+    assert len({interval, TimeInterval(time(9, 0), time(10, 0))}) == 1
+
+
 def test_time_to_minutes():
     """Test to minutes."""
     assert 570 == time_to_minutes(time(9,30))
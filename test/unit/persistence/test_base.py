@@ -64,6 +64,36 @@ class TestCSVDataSource:
         with pytest.raises(FileNotFoundError):
             source.read_records()
     
+    def test_read_dataframe_keeps_strings(self, tmp_path):
+        """Test empty cells and NA-like text stay as strings."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("id,conflicts\n007,\n2,None\n3,NA\n")
+        
+        source = CSVDataSource(csv_file)
+        df = source.read_dataframe()
+        
+        assert list(df['id']) == ['007', '2', '3']
+        assert list(df['conflicts']) == ['', 'None', 'NA']
+        assert source.read_records()[0] == {'id': '007', 'conflicts': ''}
+    
+    def test_iter_records_matches_read_records(self, tmp_path):
+        """Test streamed rows match the list read."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text("id,conflicts\n1,\n2,W after 6pm\n")
+        
+        source = CSVDataSource(csv_file)
+        rows = source.iter_records()
+        
+        assert next(rows) == {'id': '1', 'conflicts': ''}
+        assert [next(rows)] + list(rows) == source.read_records()[1:]
+    
+    def test_read_blank_file(self, tmp_path):
+        """Test a file with no header reads as no records."""
+        csv_file = tmp_path / "blank.csv"
+        csv_file.touch()
+        
+        assert CSVDataSource(csv_file).read_records() == []
+    
     def test_accepts_string_path(self, tmp_path):
         """Test CSVDataSource accepts string path."""
         csv_file = tmp_path / "test.csv"
@@ -156,6 +186,54 @@ class TestGoogleSheetsDataSource:
         assert records[1]['name'] == 'Bob'
         assert source.get_source_name() == "Test Sheet / Sheet1"
     
+    def test_repeat_reads_reuse_client(self, tmp_path, monkeypatch):
+        """Test a second read does not re-authorize or reopen the sheet."""
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text('{}')
+        calls = {'authorize': 0, 'open': 0, 'read': 0}
+        
+        class MockWorksheet:
+            title = 'Sheet1'
+            
+            def get_all_records(self):
+                calls['read'] += 1
+                return [{'id': '1'}]
+        
+        class MockSheet:
+            title = 'Test Sheet'
+            
+            def get_worksheet(self, idx):
+                return MockWorksheet()
+        
+        class MockClient:
+            def open_by_key(self, key):
+                calls['open'] += 1
+                return MockSheet()
+        
+        class MockCredentials:
+            @staticmethod
+            def from_service_account_file(path, scopes):
+                return MockCredentials()
+        
+        class MockGspread:
+            @staticmethod
+            def authorize(creds):
+                calls['authorize'] += 1
+                return MockClient()
+        
+        import sys
+        monkeypatch.setitem(sys.modules, 'gspread', MockGspread)
+        
+        fake_google_auth = type(sys)('google.oauth2.service_account')
+        fake_google_auth.Credentials = MockCredentials
+        monkeypatch.setitem(sys.modules, 'google.oauth2.service_account', fake_google_auth)
+        
+        source = GoogleSheetsDataSource("sheet_123", creds_file, "0")
+        source.read_records()
+        source.read_records()
+        
+        assert calls == {'authorize': 1, 'open': 1, 'read': 2}
+    
     def test_read_with_url_instead_of_id(self, tmp_path, monkeypatch):
         """Test reading from sheet using URL instead of ID."""
         creds_file = tmp_path / "creds.json"
@@ -0,0 +1,270 @@
+"""
+Tests for SchedulingDataLoader's disk cache and cast matrix grids, and
+for load_from_csv.
+
+The Google services are replaced by small fakes, so no credentials or
+network access are needed.
+"""
+
+import csv
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from rehearsal_scheduler.constraints import RehearsalSlot
+from rehearsal_scheduler.domain.conflict_catalog import find_conflicts_by_dance
+from rehearsal_scheduler.persistence import data_loader
+from rehearsal_scheduler.persistence.data_loader import (
+    CACHE_SCOPES,
+    SCOPES,
+    SchedulingDataLoader,
+    load_from_csv
+)
+
+
+SHEETS = {
+    'dances': [['dance_id', 'name'], ['d1', 'Waltz'], ['d2', 'Tango']],
+    'dancers': [['dancer_id', 'name'], ['p1', 'Ann']],
+    'dance_groups': [
+        ['dg_id', 'dg_name', 'current_rd', 'current_rd_name', 'notes'],
+        ['g1', 'Group 1', 'rd1', 'Rae', ''],
+    ],
+    'dance_cast': [
+        ['dancer_id', 'full_name', 'd1', 'd2'],
+        ['', '', 'Waltz', 'Tango'],
+        ['p1', 'Ann', '1', '0'],
+        ['p2', 'Bo', '', '1'],
+    ],
+}
+
+
+class _Request:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self, http=None):
+        return self._result
+
+
+class FakeSheets:
+    """Stands in for the Sheets service; counts batchGet calls."""
+
+    def __init__(self):
+        self.batch_gets = 0
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range):
+        return _Request({'values': SHEETS[range]})
+
+    def batchGet(self, spreadsheetId, ranges):
+        self.batch_gets += 1
+        return _Request({'valueRanges': [{'values': SHEETS[name]} for name in ranges]})
+
+
+class FakeDrive:
+    """Stands in for the Drive service; reports a settable version."""
+
+    def __init__(self):
+        self.version = '1'
+
+    def files(self):
+        return self
+
+    def get(self, fileId, fields):
+        return _Request({'version': self.version})
+
+
+@pytest.fixture
+def services(monkeypatch):
+    """Patch the service builders; returns (sheets, drive, requested scopes)."""
+    sheets, drive, scopes = FakeSheets(), FakeDrive(), []
+
+    def build_service(credentials_path, scopes_=tuple(SCOPES)):
+        scopes.append(scopes_)
+        return None, sheets
+
+    monkeypatch.setattr(data_loader, '_build_service', build_service)
+    monkeypatch.setattr(data_loader, '_build_drive_service', lambda path: drive)
+    return sheets, drive, scopes
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Minimal loader config file."""
+    path = tmp_path / 'config.yaml'
+    path.write_text(
+        "workbooks:\n  scheduling: wb1\n  lookup_tables: wb2\n"
+        "sheets:\n  scheduling: {}\n  lookup_tables: {}\n"
+    )
+    return path
+
+
+def _read(config, cache_dir):
+    loader = SchedulingDataLoader(config, cache_dir=cache_dir)
+    return loader._batch_read('wb1', ['dances', 'dancers'])
+
+
+class TestDiskCache:
+    """Tests for the cache_dir option."""
+
+    def test_no_cache_dir_requests_sheets_scope_only(self, services, config):
+        """Test the Drive scope is only requested with a cache."""
+        _, _, scopes = services
+
+        SchedulingDataLoader(config)
+
+        assert scopes == [tuple(SCOPES)]
+
+    def test_cache_dir_requests_drive_scope(self, services, config, tmp_path):
+        """Test enabling the cache adds the Drive metadata scope."""
+        _, _, scopes = services
+
+        SchedulingDataLoader(config, cache_dir=tmp_path / 'cache')
+
+        assert scopes == [tuple(CACHE_SCOPES)]
+
+    def test_miss_then_hit(self, services, config, tmp_path):
+        """Test a second read at the same version comes from disk."""
+        sheets, _, _ = services
+        cache_dir = tmp_path / 'cache'
+
+        first = _read(config, cache_dir)
+        second = _read(config, cache_dir)
+
+        assert sheets.batch_gets == 1
+        assert list(second) == ['dances', 'dancers']
+        for name in first:
+            assert second[name].equals(first[name])
+
+    def test_stale_version_refetches(self, services, config, tmp_path):
+        """Test an edited spreadsheet is read again."""
+        sheets, drive, _ = services
+        cache_dir = tmp_path / 'cache'
+
+        _read(config, cache_dir)
+        drive.version = '2'
+        _read(config, cache_dir)
+        _read(config, cache_dir)
+
+        assert sheets.batch_gets == 2
+
+    @pytest.mark.parametrize('damage', ['missing', 'truncated', 'empty'])
+    def test_damaged_cache_file_refetches(self, services, config, tmp_path, damage):
+        """Test a missing or corrupt pickle is a miss, not an error."""
+        sheets, _, _ = services
+        cache_dir = tmp_path / 'cache'
+        first = _read(config, cache_dir)
+
+        pkl = cache_dir / 'wb1' / '0.pkl'
+        if damage == 'missing':
+            pkl.unlink()
+        elif damage == 'truncated':
+            pkl.write_bytes(pkl.read_bytes()[:10])
+        else:
+            pkl.write_bytes(b'')
+
+        result = _read(config, cache_dir)
+
+        assert sheets.batch_gets == 2
+        assert result['dances'].equals(first['dances'])
+
+
+class TestReadTyped:
+    """Tests for the per-sheet _SCHEMAS dtypes."""
+
+    def test_dance_groups_schema_applies(self, services, config):
+        """Test the dance_groups schema types the sheet's real columns."""
+        df = SchedulingDataLoader(config)._read_typed(
+            'scheduling', 'dance_groups', 'dance_groups'
+        )
+
+        for col in ('dg_id', 'dg_name', 'current_rd', 'current_rd_name'):
+            assert df[col].dtype == 'str', col
+        # Columns not in the schema stay object
+        assert df['notes'].dtype == object
+
+    def test_schema_columns_exist_in_sheet(self, services, config):
+        """Test every dance_groups schema column is one the sheet has."""
+        df = SchedulingDataLoader(config).load_dance_groups()
+
+        assert set(data_loader._SCHEMAS['dance_groups']) <= set(df.columns)
+
+
+class TestCastGrid:
+    """Tests for the dense and sparse cast matrix grids."""
+
+    def test_dense_grid(self, services, config):
+        """Test the default grid is int8 with the 1/0 cells."""
+        grid = SchedulingDataLoader(config).load_dance_cast()
+
+        assert list(grid.index) == ['p1', 'p2']
+        assert list(grid.columns) == ['d1', 'd2']
+        assert (grid.dtypes == 'int8').all()
+        assert grid.values.tolist() == [[1, 0], [0, 1]]
+
+    def test_sparse_grid(self, services, config):
+        """Test dense=False gives Sparse[int8, 0] with the same values."""
+        loader = SchedulingDataLoader(config)
+
+        dense = loader.load_dance_cast()
+        sparse = loader.load_dance_cast(dense=False)
+
+        assert (sparse.dtypes == pd.SparseDtype('int8', 0)).all()
+        assert sparse.sparse.density == 0.5
+        assert sparse.sparse.to_dense().equals(dense)
+
+
+# Sheets as export_workbooks writes them: raw values, short rows padded
+EXPORTS = {
+    'rehearsals': [['rehearsal_id', 'venue_id'], ['r1', 'v1']],
+    'rd_constraints': [['rd_id', 'full_name', 'constraints'], ['rd1', 'Rae', '']],
+    'dancer_constraints': [
+        ['dancer_id', 'full_name', 'constraints'],
+        ['p1', 'Ann', 'Monday'],
+        ['p2', 'Bo', 'Tuesday'],
+    ],
+    'dance_groups': [['dg_id', 'dg_name'], ['g1', 'Group 1']],
+    'dance_cast': SHEETS['dance_cast'],
+    'dances': SHEETS['dances'],
+    'dancers': SHEETS['dancers'],
+    'rds': [['rd_id', 'full_name'], ['rd1', 'Rae']],
+}
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """Directory of exported CSVs."""
+    for name, rows in EXPORTS.items():
+        width = max(len(row) for row in rows)
+        with open(tmp_path / f"{name}.csv", 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(row + [''] * (width - len(row)) for row in rows)
+    return tmp_path
+
+
+class TestLoadFromCsv:
+    """Tests for load_from_csv on exported sheets."""
+
+    def test_cast_grid_matches_sheets_loader(self, services, config, csv_dir):
+        """Test the exported cast matrix gives the same int8 grid as Sheets."""
+        data = load_from_csv(csv_dir)
+
+        expected = SchedulingDataLoader(config).load_dance_cast()
+        assert data['dance_cast'].equals(expected)
+
+    def test_cast_grid_finds_conflicts(self, csv_dir):
+        """Test dancers in the exported cast are matched against constraints."""
+        data = load_from_csv(csv_dir)
+        slot = RehearsalSlot(date(2026, 1, 5), 'monday', 1800, 2000)
+
+        conflicts = find_conflicts_by_dance(
+            slot, data['dances'], data['dance_cast'], data['dancer_constraints']
+        )
+
+        assert list(conflicts) == ['d1']
+        assert [c.entity_id for c in conflicts['d1']] == ['p1']
@@ -0,0 +1,52 @@
+"""
+Tests for the conflict catalog formatters.
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from rehearsal_scheduler.constraints import RehearsalSlot
+from rehearsal_scheduler.domain.conflict_catalog import ConflictInfo, SlotCatalogEntry
+from rehearsal_scheduler.reporting.catalog_formatter import (
+    format_catalog_markdown,
+    format_catalog_text
+)
+
+
+def _catalog():
+    slot = RehearsalSlot(
+        rehearsal_date=date(2026, 1, 5),
+        day_of_week='monday',
+        start_time=905,
+        end_time=1730
+    )
+    conflict = ConflictInfo('p1', 'Ann Lee', 'monday', 'Unavailable all day')
+    return [SlotCatalogEntry(slot, 'CC', [], {'d1': [conflict]})]
+
+
+DANCES = pd.DataFrame({'dance_id': ['d1'], 'name': ['Waltz']})
+
+
+def test_markdown_pinned_header():
+    """Test generated_at replaces the current time in the markdown header."""
+    report = format_catalog_markdown(_catalog(), DANCES, generated_at='2026-01-02 03:04')
+
+    assert report.startswith(
+        "# Rehearsal Conflict Catalog\n\n**Generated:** 2026-01-02 03:04\n"
+    )
+    assert "## Monday 01/05/26" in report
+    assert "**Time:** 9:05 - 17:30" in report
+    assert "Waltz" in report
+    # Same inputs and timestamp give the same report
+    assert report == format_catalog_markdown(
+        _catalog(), DANCES, generated_at='2026-01-02 03:04'
+    )
+
+
+def test_text_pinned_header():
+    """Test generated_at replaces the current time in the text header."""
+    report = format_catalog_text(_catalog(), DANCES, generated_at='2026-01-02 03:04')
+
+    assert report.splitlines()[1] == "Generated: 2026-01-02 03:04"
+    assert "Time: 9:05 - 17:30" in report
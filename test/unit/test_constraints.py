@@ -353,4 +353,30 @@ def test_time_on_day_constraint_edge_times():
     # Full day
     full_day = TimeOnDayConstraint('saturday', 0, 2359)
     assert full_day.start_time == 0
-    assert full_day.end_time == 2359
\ No newline at end of file
+    assert full_day.end_time == 2359
+
+def test_constraints_use_slots():
+    """Test that constraint objects carry no per-instance __dict__."""
+    constraints = [
+        DayOfWeekConstraint('monday'),
+        TimeOnDayConstraint('monday', 900, 1000),
+        DateConstraint(date(2025, 1, 1)),
+        DateRangeConstraint(date(2025, 1, 1), date(2025, 1, 2)),
+        RehearsalSlot(date(2025, 1, 6), 'monday', 900, 1000),
+    ]
+
+    for constraint in constraints:
+        assert not hasattr(constraint, '__dict__')
+
+
+def test_date_constraints_frozen_and_hashable():
+    """Test that date constraints are immutable, so cached parses can be shared."""
+    single = DateConstraint(date(2025, 1, 1))
+    span = DateRangeConstraint(date(2025, 1, 1), date(2025, 1, 2))
+
+    with pytest.raises(AttributeError):
+        single.date = date(2025, 1, 2)
+    with pytest.raises(AttributeError):
+        span.end_date = date(2025, 1, 3)
+
+    assert len({single, DateConstraint(date(2025, 1, 1)), span}) == 2
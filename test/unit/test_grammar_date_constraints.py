@@ -23,4 +23,11 @@ def test_validate_token_with_good_date_slash_yyyy():
 def test_validate_token_with_good_date_range():
     expected = [DateRangeConstraint(date(2026,1,2), date(2026,1,5))]
     result, emsg = validate_token("Jan 2 26-Jan 5 2026")
-    assert result == expected
\ No newline at end of file
+    assert result == expected
+
+
+def test_validate_token_month_text_any_case():
+    expected = [DateConstraint(date(2026,3,4))]
+    for text in ("mar 4 26", "Mar 4 26", "MAR 4 26", "mAr 4 26"):
+        result, emsg = validate_token(text)
+        assert result == expected, text
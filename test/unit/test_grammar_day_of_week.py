@@ -1,7 +1,7 @@
 # tests/unit/test_grammar_day_of_week.py
 
 import pytest
-from rehearsal_scheduler.grammar import constraint_parser
+from rehearsal_scheduler.grammar import constraint_parser, validate_token
 from rehearsal_scheduler.constraints import DayOfWeekConstraint 
 
 @pytest.fixture
@@ -92,4 +92,13 @@ def test_day_of_week_5_days(parser, conflict_string):
                                              DayOfWeekConstraint("friday"),
                                             ]
 
-# 
\ No newline at end of file
+# 
+
+def test_debug_parser_does_not_leak_into_default_parser(capsys):
+    """A debug parser prints; later validate_token parses stay quiet."""
+    constraint_parser(debug=True).parse("mon 2-4")
+    assert capsys.readouterr().out
+
+    validate_token("tu after 5")
+    validate_token("w 1-3")
+    assert capsys.readouterr().out == ""
@@ -1,6 +1,6 @@
 # tests/unit/test_grammar_semantic_error.py
 
-from rehearsal_scheduler.grammar import validate_token
+from rehearsal_scheduler.grammar import validate_token, validate_tokens
 from rehearsal_scheduler.constraints import DateConstraint
 from datetime import date
 
@@ -16,7 +16,8 @@ def test_invalid_12_hour_format():
     assert expected in emsg
 
 def test_invalid_0_am():
-    expected = "   ^"
+    # The caret sits under the rejected "0"
+    expected = "w 0am\n  ^\nExpected"
     _, emsg = validate_token("w 0am")
     assert expected in emsg
 
@@ -49,3 +50,26 @@ def test_validate_token_with_good_token():
     expected = [DateConstraint(date(2026,1,2))]
     result, emsg = validate_token("Jan 2 26")
     assert result == expected
+
+def test_validate_token_repeated_calls_return_fresh_lists():
+    first, _ = validate_token("Jan 2 26")
+    first.append("mutated")
+    second, emsg = validate_token("Jan 2 26")
+    assert emsg is None
+    assert second == [DateConstraint(date(2026,1,2))]
+
+def test_validate_token_repeated_error_is_stable():
+    expected = "th 5-2pm: Start time 17:00:00 must be before end time 14:00:00."
+    assert validate_token("th 5-2pm") == (None, expected)
+    assert validate_token("th 5-2pm") == (None, expected)
+
+def test_invalid_military_hour():
+    expected = "m 2400-2430: hour must be in 0..23"
+    _, emsg = validate_token("m 2400-2430")
+    assert emsg == expected
+
+def test_validate_tokens_matches_validate_token():
+    tokens = ["Jan 2 26", "th 5-2pm", "Jan 2 26", "notaday"]
+    results = validate_tokens(tokens)
+    assert results == [validate_token(token) for token in tokens]
+    assert results[0][0] is not results[2][0]
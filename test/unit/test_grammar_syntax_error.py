@@ -30,3 +30,8 @@ def test_parser_raises_lark_error_for_bad_syntax(parser, invalid_string):
     """
     with pytest.raises(LarkError):
         parser.parse(invalid_string)
+
+
+def test_default_parser_is_shared():
+    """The default parser is built once and reused."""
+    assert constraint_parser() is constraint_parser()
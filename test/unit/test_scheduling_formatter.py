@@ -0,0 +1,40 @@
+"""
+Tests for the scheduling catalog formatters.
+"""
+
+from datetime import date
+
+from rehearsal_scheduler.constraints import RehearsalSlot
+from rehearsal_scheduler.domain.scheduling_catalog import SchedulingSlotEntry
+from rehearsal_scheduler.reporting.scheduling_formatter import (
+    format_scheduling_catalog_markdown,
+    format_scheduling_catalog_text
+)
+
+
+def _catalog():
+    slot = RehearsalSlot(
+        rehearsal_date=date(2026, 1, 5),
+        day_of_week='monday',
+        start_time=905,
+        end_time=1730
+    )
+    return [SchedulingSlotEntry(slot, 'CC', [], [], {})]
+
+
+def test_markdown_pinned_header():
+    """Test generated_at replaces the current time in the markdown header."""
+    report = format_scheduling_catalog_markdown(_catalog(), generated_at='2026-01-02 03:04')
+
+    assert report.startswith(
+        "# Rehearsal Scheduling Catalog\n\n**Generated:** 2026-01-02 03:04\n"
+    )
+    assert "**Time:** 9:05 - 17:30" in report
+
+
+def test_text_pinned_header():
+    """Test generated_at replaces the current time in the text header."""
+    report = format_scheduling_catalog_text(_catalog(), generated_at='2026-01-02 03:04')
+
+    assert report.splitlines()[1] == "Generated: 2026-01-02 03:04"
+    assert "Time: 9:05 - 17:30" in report